@@ -1,20 +1,27 @@
 from __future__ import annotations
 
 import argparse
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 
-from review_agent.core.findings import FindingCollection, Severity
+from review_agent.core.findings import Finding, FindingCollection, Severity
 from review_agent.passes import CorrectnessPass, PerformancePass, SecurityPass, StylePass
+from review_agent.passes.correctness import BasePass
 
 
-PASSES = {
+PASSES: dict[str, type[BasePass] | type[StylePass]] = {
     "correctness": CorrectnessPass,
     "performance": PerformancePass,
     "security": SecurityPass,
     "style": StylePass,
 }
 
+# Below this many files, worker startup costs more than the analysis itself
+PARALLEL_MIN_FILES = 8
+
 
 def collect_python_files(paths: list[Path], recursive: bool) -> list[Path]:
     files: list[Path] = []
@@ -27,7 +34,7 @@ def collect_python_files(paths: list[Path], recursive: bool) -> list[Path]:
     return sorted(set(files))
 
 
-def format_finding_text(finding, show_suggestions: bool) -> str:
+def format_finding_text(finding: Finding, show_suggestions: bool) -> str:
     line = str(finding)
     if show_suggestions and finding.suggestion:
         line += f"\n    Suggestion: {finding.suggestion}"
@@ -39,30 +46,34 @@ def format_findings_json(findings: FindingCollection) -> str:
     return json.dumps([f.to_dict() for f in findings], indent=2)
 
 
+def analyze_file(
+    file_path: Path, pass_names: list[str], min_severity: Severity
+) -> list[Finding]:
+    """Run the selected passes over one file; module-level so worker processes can pickle it."""
+    findings: list[Finding] = []
+    for name in pass_names:
+        findings.extend(PASSES[name]().analyze(file_path, min_severity))
+    return findings
+
+
 def run_analysis(
     files: list[Path],
     pass_names: list[str],
     min_severity: Severity,
 ) -> FindingCollection:
     all_findings = FindingCollection()
+    # Passes drop findings below min_severity themselves, before building them
+    analyze = partial(analyze_file, pass_names=pass_names, min_severity=min_severity)
 
-    for name in pass_names:
-        pass_cls = PASSES[name]
-        pass_instance = pass_cls()
+    if len(files) < PARALLEL_MIN_FILES:
         for file_path in files:
-            findings = pass_instance.analyze(file_path)
-            all_findings.extend(list(findings))
-
-    severity_order = [Severity.ERROR, Severity.WARNING, Severity.INFO, Severity.HINT]
-    min_idx = severity_order.index(min_severity)
-    allowed = set(severity_order[: min_idx + 1])
-
-    filtered = FindingCollection()
-    for f in all_findings:
-        if f.severity in allowed:
-            filtered.add(f)
+            all_findings.extend(analyze(file_path))
+    else:
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            for findings in executor.map(analyze, files, chunksize=16):
+                all_findings.extend(findings)
 
-    return filtered
+    return all_findings
 
 
 def main(argv: list[str] | None = None) -> int:
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import cache
 from pathlib import Path
 
 
@@ -17,11 +19,20 @@ class Severity(Enum):
 
     def __lt__(self, other: "Severity") -> bool:
         """Enable sorting by severity (ERROR is highest)."""
-        order = {Severity.ERROR: 0, Severity.WARNING: 1, Severity.INFO: 2, Severity.HINT: 3}
-        return order[self] < order[other]
+        return _SEVERITY_RANK[self] < _SEVERITY_RANK[other]
 
 
-@dataclass
+# Sort rank of each severity, built once rather than on every comparison
+_SEVERITY_RANK: dict[Severity, int] = {severity: rank for rank, severity in enumerate(Severity)}
+
+
+@cache
+def severities_at_least(minimum: Severity) -> frozenset[Severity]:
+    """Return the severities at least as severe as `minimum` (ERROR is the most severe)."""
+    return frozenset(s for s in Severity if not minimum < s)
+
+
+@dataclass(slots=True)
 class Location:
     """Represents a location in source code."""
 
@@ -36,7 +47,7 @@ class Location:
         return f"{self.file}:{self.line}:{self.column}"
 
 
-@dataclass
+@dataclass(slots=True)
 class Finding:
     """Represents a single code review finding."""
 
@@ -84,8 +95,8 @@ class FindingCollection:
         """Add a finding to the collection."""
         self._findings.append(finding)
 
-    def extend(self, findings: list[Finding]) -> None:
-        """Add multiple findings to the collection."""
+    def extend(self, findings: Iterable[Finding]) -> None:
+        """Add multiple findings (any iterable, including another collection)."""
         self._findings.extend(findings)
 
     def filter_by_severity(self, severity: Severity) -> "FindingCollection":
@@ -102,7 +113,7 @@ class FindingCollection:
 
     def sorted_by_severity(self) -> list[Finding]:
         """Return findings sorted by severity (ERROR first)."""
-        return sorted(self._findings, key=lambda f: f.severity)
+        return sorted(self._findings, key=lambda f: _SEVERITY_RANK[f.severity])
 
     def sorted_by_location(self) -> list[Finding]:
         """Return findings sorted by file and line number."""
@@ -122,7 +133,7 @@ class FindingCollection:
         """Return the number of findings."""
         return len(self._findings)
 
-    def __iter__(self):
+    def __iter__(self) -> Iterator[Finding]:
         """Iterate over findings."""
         return iter(self._findings)
 
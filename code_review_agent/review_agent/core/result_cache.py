@@ -0,0 +1,77 @@
+"""Content-addressed memoization of pass results, so identical files are analyzed once."""
+
+from __future__ import annotations
+
+from collections.abc import Hashable
+from dataclasses import replace
+from pathlib import Path
+from typing import Protocol
+
+from review_agent.core.findings import Finding, FindingCollection, Severity
+from review_agent.core.source_cache import SourceFile, load_source
+
+MAX_CACHED_RESULTS = 4096
+
+
+class CachedPass(Protocol):
+    """An analysis pass whose results can be memoized."""
+
+    def _analyze_parsed(
+        self, parsed: SourceFile, file_path: Path, min_severity: Severity
+    ) -> FindingCollection: ...
+
+
+# (pass class, pass settings, min_severity, content digest) -> findings, stored as private
+# copies
+_results: dict[
+    tuple[type, tuple[tuple[str, Hashable], ...], Severity, bytes], tuple[Finding, ...]
+] = {}
+
+
+def cached_analysis(
+    analysis_pass: CachedPass, file_path: Path, min_severity: Severity
+) -> FindingCollection:
+    """
+    Load a file and run a pass's `_analyze_parsed` on it, memoized by contents rather than
+    by path.
+
+    Findings depend only on the source text, so a hit for a different path with the same
+    bytes (duplicate modules, empty __init__.py files, ...) returns the cached findings
+    relocated to the requested file. Callers always receive fresh Finding objects. Results
+    are only shared between passes of the same class with the same settings (its UPPER_CASE
+    attributes, such as StylePass.MAX_LINE_LENGTH), so subclasses and reconfigured
+    instances are analyzed separately.
+
+    Raises FileNotFoundError if the file does not exist.
+    """
+    parsed = load_source(file_path)
+    key = (type(analysis_pass), _settings(analysis_pass), min_severity, parsed.digest)
+    cached = _results.get(key)
+    if cached is None:
+        findings = analysis_pass._analyze_parsed(parsed, file_path, min_severity)
+        if len(_results) >= MAX_CACHED_RESULTS:
+            del _results[next(iter(_results))]
+        _results[key] = tuple(_relocate(f, file_path) for f in findings)
+        return findings
+    return FindingCollection([_relocate(f, file_path) for f in cached])
+
+
+def clear_result_cache() -> None:
+    """Drop all memoized results."""
+    _results.clear()
+
+
+def _settings(analysis_pass: CachedPass) -> tuple[tuple[str, Hashable], ...]:
+    # Class or instance level, so overrides made either way change the key
+    return tuple(
+        (name, getattr(analysis_pass, name)) for name in dir(analysis_pass) if name.isupper()
+    )
+
+
+def _relocate(finding: Finding, file_path: Path) -> Finding:
+    return replace(
+        finding,
+        location=replace(finding.location, file=file_path),
+        metadata=dict(finding.metadata),
+    )
+
@@ -0,0 +1,87 @@
+"""Shared, memoized loading of source files so each file is read and parsed once per run."""
+
+from __future__ import annotations
+
+import ast
+import hashlib
+import mmap
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+
+# Files at least this large are memory-mapped and parsed straight from the mapping
+MMAP_THRESHOLD = 64 * 1024
+
+# SourceFile carries nothing path-specific, so identical bytes (duplicate files, or the
+# same text handed to analyze_source() by every pass) are decoded and parsed only once
+MAX_CACHED_CONTENTS = 512
+
+# Placeholder path for findings on source text that did not come from a file
+SOURCE_PATH = Path("<string>")
+
+
+@dataclass(frozen=True)
+class SourceFile:
+    """Decoded text, lines (without line endings) and AST of a file, shared read-only by passes."""
+
+    source: str
+    lines: tuple[str, ...]
+    tree: ast.Module | None
+    digest: bytes
+    syntax_error: SyntaxError | None = None
+
+    def require_tree(self) -> ast.Module:
+        """Return the parsed tree, raising the cached SyntaxError if parsing failed."""
+        if self.tree is None:
+            assert self.syntax_error is not None
+            raise self.syntax_error.with_traceback(None)
+        return self.tree
+
+
+_by_digest: dict[bytes, SourceFile] = {}
+
+
+def load_source(file_path: Path) -> SourceFile:
+    """
+    Load and parse a file, reusing the result while the file is unchanged.
+
+    Raises FileNotFoundError if the file does not exist.
+    """
+    stat = file_path.stat()
+    return _load(str(file_path), stat.st_mtime_ns, stat.st_size)
+
+
+def parse_source(source: str, file_path: Path = SOURCE_PATH) -> SourceFile:
+    """Parse in-memory source text without touching the filesystem."""
+    return _build(str(file_path), source.encode())
+
+
+@lru_cache(maxsize=1024)
+def _load(path: str, mtime_ns: int, size: int) -> SourceFile:
+    # mtime_ns and size are only part of the cache key, so edits invalidate the entry
+    with open(path, "rb") as f:
+        if size < MMAP_THRESHOLD:
+            return _build(path, f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return _build(path, mm)
+
+
+def _build(path: str, data: bytes | mmap.mmap) -> SourceFile:
+    digest = hashlib.blake2b(data, digest_size=16).digest()
+    parsed = _by_digest.get(digest)
+    if parsed is None:
+        parsed = _parse(path, data, digest)
+        if len(_by_digest) >= MAX_CACHED_CONTENTS:
+            del _by_digest[next(iter(_by_digest))]
+        _by_digest[digest] = parsed
+    return parsed
+
+
+def _parse(path: str, data: bytes | mmap.mmap, digest: bytes) -> SourceFile:
+    source = str(data, "utf-8", "replace")
+    lines = tuple(source.splitlines())
+    try:
+        tree = ast.parse(data, path)
+    except SyntaxError as e:
+        return SourceFile(source=source, lines=lines, tree=None, digest=digest, syntax_error=e)
+    return SourceFile(source=source, lines=lines, tree=tree, digest=digest)
@@ -4,9 +4,23 @@ from __future__ import annotations
 
 import ast
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from pathlib import Path
-
-from review_agent.core.findings import Finding, FindingCollection, Location, Severity
+from typing import Any
+
+from review_agent.core.findings import (
+    Finding,
+    FindingCollection,
+    Location,
+    Severity,
+    severities_at_least,
+)
+from review_agent.core.result_cache import cached_analysis
+from review_agent.core.source_cache import (
+    SOURCE_PATH,
+    SourceFile,
+    parse_source,
+)
 
 
 class BasePass(ABC):
@@ -25,15 +39,35 @@ class BasePass(ABC):
         ...
 
     @abstractmethod
-    def analyze(self, file_path: Path) -> FindingCollection:
-        """Analyze a file and return findings."""
+    def analyze(
+        self, file_path: Path, min_severity: Severity = Severity.HINT
+    ) -> FindingCollection:
+        """Analyze a file and return findings at or above `min_severity`."""
+        ...
+
+    def analyze_source(
+        self,
+        source: str,
+        file_path: Path = SOURCE_PATH,
+        min_severity: Severity = Severity.HINT,
+    ) -> FindingCollection:
+        """Analyze in-memory source text; `file_path` only labels the findings."""
+        return self._analyze_parsed(parse_source(source, file_path), file_path, min_severity)
+
+    @abstractmethod
+    def _analyze_parsed(
+        self, parsed: SourceFile, file_path: Path, min_severity: Severity
+    ) -> FindingCollection:
+        """Run the pass over an already loaded source file."""
         ...
 
-    def analyze_multiple(self, file_paths: list[Path]) -> FindingCollection:
+    def analyze_multiple(
+        self, file_paths: list[Path], min_severity: Severity = Severity.HINT
+    ) -> FindingCollection:
         """Analyze multiple files and return combined findings."""
         collection = FindingCollection()
         for file_path in file_paths:
-            collection.extend(list(self.analyze(file_path)))
+            collection.extend(self.analyze(file_path, min_severity))
         return collection
 
 
@@ -58,37 +92,45 @@ class CorrectnessPass(BasePass):
     def description(self) -> str:
         return "Detects bugs, logic errors, and potential runtime failures"
 
-    def analyze(self, file_path: Path) -> FindingCollection:
+    def analyze(
+        self, file_path: Path, min_severity: Severity = Severity.HINT
+    ) -> FindingCollection:
         """Analyze a Python file for correctness issues."""
-        findings = FindingCollection()
-
         try:
-            source = file_path.read_text(encoding="utf-8")
-            tree = ast.parse(source, filename=str(file_path))
-        except SyntaxError as e:
+            return cached_analysis(self, file_path, min_severity)
+        except FileNotFoundError:
+            findings = FindingCollection()
             findings.add(
                 Finding(
-                    message=f"Syntax error: {e.msg}",
+                    message=f"File not found: {file_path}",
                     severity=Severity.ERROR,
-                    location=Location(file=file_path, line=e.lineno or 1, column=e.offset or 0),
-                    rule_id="COR001",
+                    location=Location(file=file_path, line=1, column=0),
+                    rule_id="COR000",
                     category="correctness",
                 )
             )
             return findings
-        except FileNotFoundError:
+
+    def _analyze_parsed(
+        self, parsed: SourceFile, file_path: Path, min_severity: Severity
+    ) -> FindingCollection:
+        findings = FindingCollection()
+
+        try:
+            tree = parsed.require_tree()
+        except SyntaxError as e:
             findings.add(
                 Finding(
-                    message=f"File not found: {file_path}",
+                    message=f"Syntax error: {e.msg}",
                     severity=Severity.ERROR,
-                    location=Location(file=file_path, line=1, column=0),
-                    rule_id="COR000",
+                    location=Location(file=file_path, line=e.lineno or 1, column=e.offset or 0),
+                    rule_id="COR001",
                     category="correctness",
                 )
             )
             return findings
 
-        checker = _CorrectnessChecker(file_path, findings)
+        checker = _CorrectnessChecker(file_path, findings, min_severity)
         checker.visit(tree)
 
         return findings
@@ -97,12 +139,38 @@ class CorrectnessPass(BasePass):
 class _CorrectnessChecker(ast.NodeVisitor):
     """AST visitor that checks for correctness issues."""
 
-    def __init__(self, file_path: Path, findings: FindingCollection) -> None:
+    def __init__(
+        self, file_path: Path, findings: FindingCollection, min_severity: Severity
+    ) -> None:
         self.file_path = file_path
         self.findings = findings
+        self.allowed_severities = severities_at_least(min_severity)
         self.defined_names: set[str] = set()
         self.imported_names: set[str] = set()
         self.used_names: set[str] = set()
+        # Exact node type -> handler; skips NodeVisitor's per-node "visit_" + name getattr
+        self._dispatch: dict[type[ast.AST], Callable[[Any], None]] = {
+            ast.Import: self.visit_Import,
+            ast.ImportFrom: self.visit_ImportFrom,
+            ast.Compare: self.visit_Compare,
+            ast.FunctionDef: self.visit_FunctionDef,
+            ast.AsyncFunctionDef: self.visit_AsyncFunctionDef,
+            ast.ExceptHandler: self.visit_ExceptHandler,
+            ast.Assert: self.visit_Assert,
+            # Leaves as far as these checks go: nothing below them is inspected
+            ast.Name: self._skip,
+            ast.Constant: self._skip,
+        }
+
+    def visit(self, node: ast.AST) -> None:
+        handler = self._dispatch.get(type(node))
+        if handler is None:
+            self.generic_visit(node)
+        else:
+            handler(node)
+
+    def _skip(self, node: ast.AST) -> None:
+        pass
 
     def _add_finding(
         self,
@@ -114,6 +182,8 @@ class _CorrectnessChecker(ast.NodeVisitor):
         suggestion: str | None = None,
     ) -> None:
         """Helper to add a finding."""
+        if severity not in self.allowed_severities:
+            return
         self.findings.add(
             Finding(
                 message=message,
@@ -3,11 +3,29 @@
 from __future__ import annotations
 
 import ast
+from collections.abc import Callable
 from pathlib import Path
-
-from review_agent.core.findings import Finding, FindingCollection, Location, Severity
+from typing import Any
+
+from review_agent.core.findings import (
+    Finding,
+    FindingCollection,
+    Location,
+    Severity,
+    severities_at_least,
+)
+from review_agent.core.result_cache import cached_analysis
+from review_agent.core.source_cache import SourceFile
 from review_agent.passes.correctness import BasePass
 
+# constructor name -> (rule_id, literal, display form)
+_CONSTRUCTORS: dict[str, tuple[str, str, str]] = {
+    "dict": ("PERF005", "{}", "dict()"),
+    "list": ("PERF005", "[]", "list()"),
+    "tuple": ("PERF005", "()", "tuple()"),
+}
+_CONSTRUCTOR_NAMES: frozenset[str] = frozenset(_CONSTRUCTORS)
+
 
 class PerformancePass(BasePass):
     """
@@ -31,36 +49,44 @@ class PerformancePass(BasePass):
     def description(self) -> str:
         return "Detects inefficient code patterns and performance anti-patterns"
 
-    def analyze(self, file_path: Path) -> FindingCollection:
-        findings = FindingCollection()
-
+    def analyze(
+        self, file_path: Path, min_severity: Severity = Severity.HINT
+    ) -> FindingCollection:
         try:
-            source = file_path.read_text(encoding="utf-8")
-            tree = ast.parse(source, filename=str(file_path))
-        except SyntaxError as e:
+            return cached_analysis(self, file_path, min_severity)
+        except FileNotFoundError:
+            findings = FindingCollection()
             findings.add(
                 Finding(
-                    message=f"Syntax error: {e.msg}",
+                    message=f"File not found: {file_path}",
                     severity=Severity.ERROR,
-                    location=Location(file=file_path, line=e.lineno or 1, column=e.offset or 0),
+                    location=Location(file=file_path, line=1, column=0),
                     rule_id="PERF000",
                     category="performance",
                 )
             )
             return findings
-        except FileNotFoundError:
+
+    def _analyze_parsed(
+        self, parsed: SourceFile, file_path: Path, min_severity: Severity
+    ) -> FindingCollection:
+        findings = FindingCollection()
+
+        try:
+            tree = parsed.require_tree()
+        except SyntaxError as e:
             findings.add(
                 Finding(
-                    message=f"File not found: {file_path}",
+                    message=f"Syntax error: {e.msg}",
                     severity=Severity.ERROR,
-                    location=Location(file=file_path, line=1, column=0),
+                    location=Location(file=file_path, line=e.lineno or 1, column=e.offset or 0),
                     rule_id="PERF000",
                     category="performance",
                 )
             )
             return findings
 
-        checker = _PerformanceChecker(file_path, findings)
+        checker = _PerformanceChecker(file_path, findings, min_severity)
         checker.visit(tree)
 
         return findings
@@ -68,9 +94,35 @@ class PerformancePass(BasePass):
 
 class _PerformanceChecker(ast.NodeVisitor):
 
-    def __init__(self, file_path: Path, findings: FindingCollection) -> None:
+    def __init__(
+        self, file_path: Path, findings: FindingCollection, min_severity: Severity
+    ) -> None:
         self.file_path = file_path
         self.findings = findings
+        self.allowed_severities = severities_at_least(min_severity)
+        # Number of enclosing for-loops, so PERF002 is checked as the walk reaches each +=
+        self._for_depth = 0
+        # Exact node type -> handler; skips NodeVisitor's per-node "visit_" + name getattr
+        self._dispatch: dict[type[ast.AST], Callable[[Any], None]] = {
+            ast.For: self.visit_For,
+            ast.AugAssign: self.visit_AugAssign,
+            ast.Compare: self.visit_Compare,
+            ast.Call: self.visit_Call,
+            ast.Subscript: self.visit_Subscript,
+            # Leaves as far as these checks go: nothing below them is inspected
+            ast.Name: self._skip,
+            ast.Constant: self._skip,
+        }
+
+    def visit(self, node: ast.AST) -> None:
+        handler = self._dispatch.get(type(node))
+        if handler is None:
+            self.generic_visit(node)
+        else:
+            handler(node)
+
+    def _skip(self, node: ast.AST) -> None:
+        pass
 
     def _add_finding(
         self,
@@ -81,6 +133,8 @@ class _PerformanceChecker(ast.NodeVisitor):
         rule_id: str,
         suggestion: str | None = None,
     ) -> None:
+        if severity not in self.allowed_severities:
+            return
         self.findings.add(
             Finding(
                 message=message,
@@ -95,7 +149,13 @@ class _PerformanceChecker(ast.NodeVisitor):
     def visit_For(self, node: ast.For) -> None:
         self._check_range_len(node)
         self._check_append_in_loop(node)
-        self._check_string_concat_in_loop(node)
+        self._for_depth += 1
+        self.generic_visit(node)
+        self._for_depth -= 1
+
+    def visit_AugAssign(self, node: ast.AugAssign) -> None:
+        if self._for_depth:
+            self._check_string_concat_in_loop(node)
         self.generic_visit(node)
 
     def _check_range_len(self, node: ast.For) -> None:
@@ -123,33 +183,24 @@ class _PerformanceChecker(ast.NodeVisitor):
             suggestion="Use 'for item in collection:' or 'for i, item in enumerate(collection):'",
         )
 
-    def _check_string_concat_in_loop(self, node: ast.For) -> None:
+    def _check_string_concat_in_loop(self, node: ast.AugAssign) -> None:
         """Detect `s += '...'` inside for-loops — O(n²) string building."""
-        for stmt in ast.walk(node):
-            if not isinstance(stmt, ast.AugAssign):
-                continue
-            if not isinstance(stmt.op, ast.Add):
-                continue
-            if not isinstance(stmt.target, ast.Name):
-                continue
-            if isinstance(stmt.value, ast.Constant) and isinstance(stmt.value.value, str):
-                self._add_finding(
-                    message=f"String concatenation with += in loop (variable '{stmt.target.id}')",
-                    severity=Severity.WARNING,
-                    line=stmt.lineno,
-                    column=stmt.col_offset,
-                    rule_id="PERF002",
-                    suggestion="Use ''.join() or a list to build strings — += creates a new string each iteration",
-                )
-            elif isinstance(stmt.value, ast.JoinedStr):
-                self._add_finding(
-                    message=f"String concatenation with += in loop (variable '{stmt.target.id}')",
-                    severity=Severity.WARNING,
-                    line=stmt.lineno,
-                    column=stmt.col_offset,
-                    rule_id="PERF002",
-                    suggestion="Use ''.join() or a list to build strings — += creates a new string each iteration",
-                )
+        if not isinstance(node.op, ast.Add):
+            return
+        if not isinstance(node.target, ast.Name):
+            return
+        value = node.value
+        if isinstance(value, ast.JoinedStr) or (
+            isinstance(value, ast.Constant) and isinstance(value.value, str)
+        ):
+            self._add_finding(
+                message=f"String concatenation with += in loop (variable '{node.target.id}')",
+                severity=Severity.WARNING,
+                line=node.lineno,
+                column=node.col_offset,
+                rule_id="PERF002",
+                suggestion="Use ''.join() or a list to build strings — += creates a new string each iteration",
+            )
 
     def _check_append_in_loop(self, node: ast.For) -> None:
         """Detect simple `result.append(expr)` patterns that could be list comprehensions."""
@@ -219,20 +270,15 @@ class _PerformanceChecker(ast.NodeVisitor):
 
     def _check_constructor_vs_literal(self, node: ast.Call) -> None:
         """Detect dict(), list(), tuple() with no args — literals are faster."""
-        if not isinstance(node.func, ast.Name):
+        func = node.func
+        if not isinstance(func, ast.Name):
+            return
+        if func.id not in _CONSTRUCTOR_NAMES:
             return
         if node.args or node.keywords:
             return
 
-        constructors = {
-            "dict": ("PERF005", "{}", "dict()"),
-            "list": ("PERF005", "[]", "list()"),
-            "tuple": ("PERF005", "()", "tuple()"),
-        }
-        entry = constructors.get(node.func.id)
-        if entry is None:
-            return
-        rule_id, literal, constructor = entry
+        rule_id, literal, constructor = _CONSTRUCTORS[func.id]
         self._add_finding(
             message=f"{constructor} is slower than {literal} literal",
             severity=Severity.HINT,
@@ -244,38 +290,31 @@ class _PerformanceChecker(ast.NodeVisitor):
 
     def visit_Subscript(self, node: ast.Subscript) -> None:
         """Detect sorted(x)[0] or sorted(x)[-1] — use min()/max() for O(n) vs O(n log n)."""
-        if not isinstance(node.value, ast.Call):
-            self.generic_visit(node)
-            return
-
-        call = node.value
-        if not (isinstance(call.func, ast.Name) and call.func.id == "sorted"):
-            self.generic_visit(node)
-            return
-
-        idx = self._resolve_index(node.slice)
-        if idx is None:
-            self.generic_visit(node)
-            return
-
-        if idx == 0:
-            self._add_finding(
-                message="sorted(...)[0] is O(n log n) — use min() for O(n)",
-                severity=Severity.WARNING,
-                line=node.lineno,
-                column=node.col_offset,
-                rule_id="PERF006",
-                suggestion="Replace sorted(x)[0] with min(x)",
-            )
-        elif idx == -1:
-            self._add_finding(
-                message="sorted(...)[-1] is O(n log n) — use max() for O(n)",
-                severity=Severity.WARNING,
-                line=node.lineno,
-                column=node.col_offset,
-                rule_id="PERF006",
-                suggestion="Replace sorted(x)[-1] with max(x)",
-            )
+        value = node.value
+        if (
+            isinstance(value, ast.Call)
+            and isinstance(value.func, ast.Name)
+            and value.func.id == "sorted"
+        ):
+            idx = self._resolve_index(node.slice)
+            if idx == 0:
+                self._add_finding(
+                    message="sorted(...)[0] is O(n log n) — use min() for O(n)",
+                    severity=Severity.WARNING,
+                    line=node.lineno,
+                    column=node.col_offset,
+                    rule_id="PERF006",
+                    suggestion="Replace sorted(x)[0] with min(x)",
+                )
+            elif idx == -1:
+                self._add_finding(
+                    message="sorted(...)[-1] is O(n log n) — use max() for O(n)",
+                    severity=Severity.WARNING,
+                    line=node.lineno,
+                    column=node.col_offset,
+                    rule_id="PERF006",
+                    suggestion="Replace sorted(x)[-1] with max(x)",
+                )
 
         self.generic_visit(node)
 
@@ -4,40 +4,54 @@ from __future__ import annotations
 
 import ast
 import re
+from collections.abc import Callable
 from pathlib import Path
-
-from review_agent.core.findings import Finding, FindingCollection, Location, Severity
+from typing import Any
+
+from review_agent.core.findings import (
+    Finding,
+    FindingCollection,
+    Location,
+    Severity,
+    severities_at_least,
+)
+from review_agent.core.result_cache import cached_analysis
+from review_agent.core.source_cache import SourceFile
 from review_agent.passes.correctness import BasePass
 
-# Regex: variable names that likely hold secrets (password, token, api_key, etc.)
-_SECRET_NAME_PATTERN = re.compile(
-    r"(password|passwd|secret|api_key|apikey|token|auth|credential|private_key)",
-    re.IGNORECASE,
+# Substrings of variable names that likely hold secrets
+_SECRET_NAME_PARTS: tuple[str, ...] = (
+    "password", "passwd", "secret", "api_key", "apikey", "token", "auth", "credential",
+    "private_key",
 )
+_SECRET_NAME_PATTERN = re.compile(f"({'|'.join(_SECRET_NAME_PARTS)})", re.IGNORECASE)
 
 _DANGEROUS_CALLS: dict[str, str] = {
     "eval": "SEC001",
     "exec": "SEC002",
 }
-
-# (module, function) -> (rule_id, message)
-_DANGEROUS_MODULE_CALLS: dict[tuple[str, str], tuple[str, str]] = {
-    ("os", "system"): ("SEC005", "Use of os.system() allows shell injection"),
-    ("os", "popen"): ("SEC005", "Use of os.popen() allows shell injection"),
-    ("pickle", "loads"): ("SEC006", "Deserializing untrusted data with pickle can execute arbitrary code"),
-    ("pickle", "load"): ("SEC006", "Deserializing untrusted data with pickle can execute arbitrary code"),
-    ("marshal", "loads"): ("SEC006", "Deserializing untrusted data with marshal can execute arbitrary code"),
-    ("shelve", "open"): ("SEC006", "shelve uses pickle internally — untrusted data risk"),
-    ("yaml", "load"): ("SEC009", "yaml.load() without SafeLoader can execute arbitrary code"),
+_DANGEROUS_CALL_NAMES: frozenset[str] = frozenset(_DANGEROUS_CALLS)
+
+# module.function -> (rule_id, message)
+_DANGEROUS_MODULE_CALLS: dict[str, tuple[str, str]] = {
+    "os.system": ("SEC005", "Use of os.system() allows shell injection"),
+    "os.popen": ("SEC005", "Use of os.popen() allows shell injection"),
+    "pickle.loads": ("SEC006", "Deserializing untrusted data with pickle can execute arbitrary code"),
+    "pickle.load": ("SEC006", "Deserializing untrusted data with pickle can execute arbitrary code"),
+    "marshal.loads": ("SEC006", "Deserializing untrusted data with marshal can execute arbitrary code"),
+    "shelve.open": ("SEC006", "shelve uses pickle internally — untrusted data risk"),
+    "yaml.load": ("SEC009", "yaml.load() without SafeLoader can execute arbitrary code"),
 }
 
-_WEAK_HASHES: set[str] = {"md5", "sha1"}
+_SUBPROCESS_FUNCS: tuple[str, ...] = ("run", "call", "check_call", "check_output", "Popen")
+
+_WEAK_HASHES: frozenset[str] = frozenset({"md5", "sha1"})
 
 # Matches SQL keywords at word boundaries for injection detection
-_SQL_KEYWORD_PATTERN = re.compile(
-    r"\b(SELECT|INSERT|UPDATE|DELETE|DROP|CREATE|ALTER|EXEC)\b",
-    re.IGNORECASE,
+_SQL_KEYWORDS: tuple[str, ...] = (
+    "SELECT", "INSERT", "UPDATE", "DELETE", "DROP", "CREATE", "ALTER", "EXEC",
 )
+_SQL_KEYWORD_PATTERN = re.compile(rf"\b({'|'.join(_SQL_KEYWORDS)})\b", re.IGNORECASE)
 
 
 class SecurityPass(BasePass):
@@ -65,36 +79,44 @@ class SecurityPass(BasePass):
     def description(self) -> str:
         return "Detects common security vulnerabilities and dangerous patterns"
 
-    def analyze(self, file_path: Path) -> FindingCollection:
-        findings = FindingCollection()
-
+    def analyze(
+        self, file_path: Path, min_severity: Severity = Severity.HINT
+    ) -> FindingCollection:
         try:
-            source = file_path.read_text(encoding="utf-8")
-            tree = ast.parse(source, filename=str(file_path))
-        except SyntaxError as e:
+            return cached_analysis(self, file_path, min_severity)
+        except FileNotFoundError:
+            findings = FindingCollection()
             findings.add(
                 Finding(
-                    message=f"Syntax error: {e.msg}",
+                    message=f"File not found: {file_path}",
                     severity=Severity.ERROR,
-                    location=Location(file=file_path, line=e.lineno or 1, column=e.offset or 0),
+                    location=Location(file=file_path, line=1, column=0),
                     rule_id="SEC000",
                     category="security",
                 )
             )
             return findings
-        except FileNotFoundError:
+
+    def _analyze_parsed(
+        self, parsed: SourceFile, file_path: Path, min_severity: Severity
+    ) -> FindingCollection:
+        findings = FindingCollection()
+
+        try:
+            tree = parsed.require_tree()
+        except SyntaxError as e:
             findings.add(
                 Finding(
-                    message=f"File not found: {file_path}",
+                    message=f"Syntax error: {e.msg}",
                     severity=Severity.ERROR,
-                    location=Location(file=file_path, line=1, column=0),
+                    location=Location(file=file_path, line=e.lineno or 1, column=e.offset or 0),
                     rule_id="SEC000",
                     category="security",
                 )
             )
             return findings
 
-        checker = _SecurityChecker(file_path, source, findings)
+        checker = _SecurityChecker(file_path, findings, min_severity)
         checker.visit(tree)
 
         return findings
@@ -103,13 +125,36 @@ class SecurityPass(BasePass):
 class _SecurityChecker(ast.NodeVisitor):
 
     def __init__(
-        self, file_path: Path, source: str, findings: FindingCollection
+        self, file_path: Path, findings: FindingCollection, min_severity: Severity
     ) -> None:
         self.file_path = file_path
-        self.source = source
-        self.source_lines = source.splitlines()
         self.findings = findings
+        self.allowed_severities = severities_at_least(min_severity)
         self._import_aliases: dict[str, str] = {}
+        # Exact node type -> handler; skips NodeVisitor's per-node "visit_" + name getattr
+        self._dispatch: dict[type[ast.AST], Callable[[Any], None]] = {
+            ast.Import: self.visit_Import,
+            ast.ImportFrom: self.visit_ImportFrom,
+            ast.Call: self.visit_Call,
+            ast.Assign: self.visit_Assign,
+            ast.AnnAssign: self.visit_AnnAssign,
+            ast.JoinedStr: self.visit_JoinedStr,
+            ast.BinOp: self.visit_BinOp,
+            ast.Assert: self.visit_Assert,
+            # Leaves as far as these checks go: nothing below them is inspected
+            ast.Name: self._skip,
+            ast.Constant: self._skip,
+        }
+
+    def visit(self, node: ast.AST) -> None:
+        handler = self._dispatch.get(type(node))
+        if handler is None:
+            self.generic_visit(node)
+        else:
+            handler(node)
+
+    def _skip(self, node: ast.AST) -> None:
+        pass
 
     def _add_finding(
         self,
@@ -120,6 +165,8 @@ class _SecurityChecker(ast.NodeVisitor):
         rule_id: str,
         suggestion: str | None = None,
     ) -> None:
+        if severity not in self.allowed_severities:
+            return
         self.findings.add(
             Finding(
                 message=message,
@@ -146,19 +193,22 @@ class _SecurityChecker(ast.NodeVisitor):
 
     def visit_Call(self, node: ast.Call) -> None:
         self._check_dangerous_builtins(node)
-        self._check_subprocess_shell(node)
-        self._check_dangerous_module_calls(node)
         self._check_dynamic_import(node)
-        self._check_weak_hashing(node)
+        qualified_name = self._resolve_module_call(node.func)
+        if qualified_name is not None:
+            handler = _MODULE_CALL_HANDLERS.get(qualified_name)
+            if handler is not None:
+                handler(self, node, qualified_name)
         self.generic_visit(node)
 
     def _check_dangerous_builtins(self, node: ast.Call) -> None:
-        if not isinstance(node.func, ast.Name):
+        func = node.func
+        if not isinstance(func, ast.Name):
             return
-        func_name = node.func.id
-        rule_id = _DANGEROUS_CALLS.get(func_name)
-        if rule_id is None:
+        func_name = func.id
+        if func_name not in _DANGEROUS_CALL_NAMES:
             return
+        rule_id = _DANGEROUS_CALLS[func_name]
         self._add_finding(
             message=f"Use of {func_name}() is a security risk — allows arbitrary code execution",
             severity=Severity.ERROR,
@@ -184,9 +234,10 @@ class _SecurityChecker(ast.NodeVisitor):
     def _check_hardcoded_secret(
         self, name: str, value: ast.expr, line: int, column: int
     ) -> None:
-        if not _SECRET_NAME_PATTERN.search(name):
+        # Most assignments are not string literals, so test the value before the name regex
+        if not (isinstance(value, ast.Constant) and isinstance(value.value, str) and value.value):
             return
-        if isinstance(value, ast.Constant) and isinstance(value.value, str) and value.value:
+        if _SECRET_NAME_PATTERN.search(name):
             self._add_finding(
                 message=f"Possible hardcoded secret in variable '{name}'",
                 severity=Severity.WARNING,
@@ -196,21 +247,8 @@ class _SecurityChecker(ast.NodeVisitor):
                 suggestion="Use environment variables or a secrets manager instead of hardcoded values",
             )
 
-    def _check_subprocess_shell(self, node: ast.Call) -> None:
-        func_name = self._resolve_call_name(node.func)
-        if func_name is None:
-            return
-
-        parts = func_name.split(".")
-        if len(parts) != 2:
-            return
-        module, attr = parts
-        resolved_module = self._import_aliases.get(module, module)
-        if resolved_module != "subprocess":
-            return
-        if attr not in ("run", "call", "check_call", "check_output", "Popen"):
-            return
-
+    def _check_subprocess_shell(self, node: ast.Call, qualified_name: str) -> None:
+        attr = qualified_name.rpartition(".")[2]
         for keyword in node.keywords:
             if keyword.arg == "shell":
                 if isinstance(keyword.value, ast.Constant) and keyword.value.value is True:
@@ -223,25 +261,11 @@ class _SecurityChecker(ast.NodeVisitor):
                         suggestion="Avoid shell=True. Pass arguments as a list to prevent shell injection",
                     )
 
-    def _check_dangerous_module_calls(self, node: ast.Call) -> None:
-        func_name = self._resolve_call_name(node.func)
-        if func_name is None:
-            return
-
-        parts = func_name.split(".")
-        if len(parts) != 2:
-            return
-        module, attr = parts
-        resolved_module = self._import_aliases.get(module, module)
-
-        key = (resolved_module, attr)
-        entry = _DANGEROUS_MODULE_CALLS.get(key)
-        if entry is None:
-            return
-        rule_id, message = entry
+    def _check_dangerous_module_call(self, node: ast.Call, qualified_name: str) -> None:
+        rule_id, message = _DANGEROUS_MODULE_CALLS[qualified_name]
 
         # yaml.load() is safe when Loader= kwarg or second positional arg is provided
-        if key == ("yaml", "load"):
+        if qualified_name == "yaml.load":
             for keyword in node.keywords:
                 if keyword.arg == "Loader":
                     return
@@ -268,40 +292,32 @@ class _SecurityChecker(ast.NodeVisitor):
                 suggestion="Use importlib.import_module() for clearer intent, or static imports where possible",
             )
 
-    def _check_weak_hashing(self, node: ast.Call) -> None:
-        func_name = self._resolve_call_name(node.func)
-        if func_name is None:
-            return
-
-        parts = func_name.split(".")
-        if len(parts) != 2:
-            return
-        module, attr = parts
-        resolved_module = self._import_aliases.get(module, module)
-
-        if resolved_module == "hashlib" and attr in _WEAK_HASHES:
-            self._add_finding(
-                message=f"Use of weak hash algorithm: hashlib.{attr}()",
-                severity=Severity.WARNING,
-                line=node.lineno,
-                column=node.col_offset,
-                rule_id="SEC008",
-                suggestion="Use hashlib.sha256() or stronger. MD5/SHA1 are broken for security purposes",
-            )
+    def _check_weak_hash_constructor(self, node: ast.Call, qualified_name: str) -> None:
+        attr = qualified_name.rpartition(".")[2]
+        self._add_finding(
+            message=f"Use of weak hash algorithm: hashlib.{attr}()",
+            severity=Severity.WARNING,
+            line=node.lineno,
+            column=node.col_offset,
+            rule_id="SEC008",
+            suggestion="Use hashlib.sha256() or stronger. MD5/SHA1 are broken for security purposes",
+        )
 
+    def _check_weak_hash_new(self, node: ast.Call, qualified_name: str) -> None:
         # hashlib.new("md5") — alternative API for weak algorithms
-        if resolved_module == "hashlib" and attr == "new" and node.args:
-            first_arg = node.args[0]
-            if isinstance(first_arg, ast.Constant) and isinstance(first_arg.value, str):
-                if first_arg.value.lower() in _WEAK_HASHES:
-                    self._add_finding(
-                        message=f"Use of weak hash algorithm: hashlib.new('{first_arg.value}')",
-                        severity=Severity.WARNING,
-                        line=node.lineno,
-                        column=node.col_offset,
-                        rule_id="SEC008",
-                        suggestion="Use 'sha256' or stronger. MD5/SHA1 are broken for security purposes",
-                    )
+        if not node.args:
+            return
+        first_arg = node.args[0]
+        if isinstance(first_arg, ast.Constant) and isinstance(first_arg.value, str):
+            if first_arg.value.lower() in _WEAK_HASHES:
+                self._add_finding(
+                    message=f"Use of weak hash algorithm: hashlib.new('{first_arg.value}')",
+                    severity=Severity.WARNING,
+                    line=node.lineno,
+                    column=node.col_offset,
+                    rule_id="SEC008",
+                    suggestion="Use 'sha256' or stronger. MD5/SHA1 are broken for security purposes",
+                )
 
     def visit_JoinedStr(self, node: ast.JoinedStr) -> None:
         self._check_sql_fstring(node, node.lineno, node.col_offset)
@@ -348,9 +364,23 @@ class _SecurityChecker(ast.NodeVisitor):
         )
         self.generic_visit(node)
 
-    def _resolve_call_name(self, func: ast.expr) -> str | None:
+    def _resolve_module_call(self, func: ast.expr) -> str | None:
+        """Resolve `alias.attr(...)` to `module.attr` using the tracked import aliases."""
         if isinstance(func, ast.Attribute) and isinstance(func.value, ast.Name):
-            return f"{func.value.id}.{func.attr}"
-        if isinstance(func, ast.Name):
-            return func.id
+            module = func.value.id
+            return f"{self._import_aliases.get(module, module)}.{func.attr}"
         return None
+
+
+_ModuleCallHandler = Callable[[_SecurityChecker, ast.Call, str], None]
+
+# Fully-qualified call name -> check, so each Call is resolved and dispatched once
+_MODULE_CALL_HANDLERS: dict[str, _ModuleCallHandler] = {
+    **{
+        f"subprocess.{name}": _SecurityChecker._check_subprocess_shell
+        for name in _SUBPROCESS_FUNCS
+    },
+    **{name: _SecurityChecker._check_dangerous_module_call for name in _DANGEROUS_MODULE_CALLS},
+    **{f"hashlib.{name}": _SecurityChecker._check_weak_hash_constructor for name in _WEAK_HASHES},
+    "hashlib.new": _SecurityChecker._check_weak_hash_new,
+}
@@ -4,9 +4,39 @@ from __future__ import annotations
 
 import ast
 import re
+import sys
+from collections.abc import Callable, Iterator, Sequence
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
+from typing import Any
 
-from review_agent.core.findings import Finding, FindingCollection, Location, Severity
+from review_agent.core.findings import (
+    Finding,
+    FindingCollection,
+    Location,
+    Severity,
+    severities_at_least,
+)
+from review_agent.core.result_cache import cached_analysis
+from review_agent.core.source_cache import (
+    SOURCE_PATH,
+    SourceFile,
+    parse_source,
+)
+
+# Word boundaries used to split CamelCase names: "HTTPServer" -> "HTTP_Server", "myVar" -> "my_Var"
+_ACRONYM_BOUNDARY_PATTERN = re.compile(r"([A-Z]+)([A-Z][a-z])")
+_CAMEL_BOUNDARY_PATTERN = re.compile(r"([a-z\d])([A-Z])")
+
+_STDLIB_MODULES: frozenset[str] = frozenset(sys.stdlib_module_names)
+
+# Expected order of import groups (STY005)
+_IMPORT_GROUPS: tuple[str, ...] = ("stdlib", "third_party", "local")
+_STDLIB_GROUP, _THIRD_PARTY_GROUP, _LOCAL_GROUP = range(len(_IMPORT_GROUPS))
+
+# Conventional first-argument names exempt from the STY013 argument naming check
+_SELF_CLS_NAMES: frozenset[str] = frozenset(("self", "cls"))
 
 
 class StylePass:
@@ -21,14 +51,15 @@ class StylePass:
     - Blank line usage
     """
 
+    # Validators use fullmatch(), so these need no anchors
+    SNAKE_CASE_PATTERN = re.compile(r"_?_?[a-z][a-z0-9_]*_?_?")
+    PASCAL_CASE_PATTERN = re.compile(r"_?[A-Z][a-zA-Z0-9]*")
+    UPPER_CASE_PATTERN = re.compile(r"_?_?[A-Z][A-Z0-9_]*_?_?")
+
     MAX_LINE_LENGTH = 100
     MAX_FUNCTION_NAME_LENGTH = 40
     MAX_VARIABLE_NAME_LENGTH = 30
 
-    SNAKE_CASE_PATTERN = re.compile(r"^_?_?[a-z][a-z0-9_]*_?_?$")
-    PASCAL_CASE_PATTERN = re.compile(r"^_?[A-Z][a-zA-Z0-9]*$")
-    UPPER_CASE_PATTERN = re.compile(r"^_?_?[A-Z][A-Z0-9_]*_?_?$")
-
     @property
     def name(self) -> str:
         return "style"
@@ -37,13 +68,13 @@ class StylePass:
     def description(self) -> str:
         return "Checks naming conventions, formatting, and code style"
 
-    def analyze(self, file_path: Path) -> FindingCollection:
-        findings = FindingCollection()
-
+    def analyze(
+        self, file_path: Path, min_severity: Severity = Severity.HINT
+    ) -> FindingCollection:
         try:
-            source = file_path.read_text(encoding="utf-8")
-            lines = source.splitlines(keepends=True)
+            return cached_analysis(self, file_path, min_severity)
         except FileNotFoundError:
+            findings = FindingCollection()
             findings.add(
                 Finding(
                     message=f"File not found: {file_path}",
@@ -55,155 +86,193 @@ class StylePass:
             )
             return findings
 
-        self._check_line_issues(file_path, lines, findings)
+    def analyze_source(
+        self,
+        source: str,
+        file_path: Path = SOURCE_PATH,
+        min_severity: Severity = Severity.HINT,
+    ) -> FindingCollection:
+        """Analyze in-memory source text; `file_path` only labels the findings."""
+        return self._analyze_parsed(parse_source(source, file_path), file_path, min_severity)
+
+    def _analyze_parsed(
+        self, parsed: SourceFile, file_path: Path, min_severity: Severity
+    ) -> FindingCollection:
+        findings = FindingCollection()
+        allowed = severities_at_least(min_severity)
 
-        try:
-            tree = ast.parse(source, filename=str(file_path))
-            self._check_imports(file_path, tree, findings)
-            checker = _StyleChecker(file_path, findings, self)
-            checker.visit(tree)
-        except SyntaxError:
-            pass
+        # Line-based rules are INFO/HINT only; skip the scans entirely when filtered out
+        findings.extend(self._iter_line_issues(file_path, parsed.source, parsed.lines, allowed))
+
+        if parsed.tree is not None:
+            checker = _StyleChecker(file_path, findings, self, allowed)
+            checker.visit(parsed.tree)
 
         return findings
 
-    def _check_line_issues(
-        self, file_path: Path, lines: list[str], findings: FindingCollection
-    ) -> None:
+    def _iter_line_issues(
+        self,
+        file_path: Path,
+        source: str,
+        lines: Sequence[str],
+        allowed: frozenset[Severity],
+    ) -> Iterator[Finding]:
+        # STY001 is screened with one C-level pass over the line lengths, so the per-line
+        # length test only runs for files that actually contain an over-long line
+        check_length = (
+            Severity.INFO in allowed
+            and max(map(len, lines), default=0) > self.MAX_LINE_LENGTH
+        )
+        check_hints = Severity.HINT in allowed  # STY002, STY003, STY004
+        if not (check_length or check_hints):
+            return
+
         consecutive_blank_lines = 0
 
         for line_num, line in enumerate(lines, start=1):
-            line_without_newline = line.rstrip("\n\r")
-
-            if len(line_without_newline) > self.MAX_LINE_LENGTH:
-                findings.add(
-                    Finding(
-                        message=f"Line too long ({len(line_without_newline)} > {self.MAX_LINE_LENGTH})",
-                        severity=Severity.INFO,
-                        location=Location(file=file_path, line=line_num, column=self.MAX_LINE_LENGTH),
-                        rule_id="STY001",
-                        category="style",
-                        suggestion=f"Break this line to be under {self.MAX_LINE_LENGTH} characters",
-                    )
+            if check_length and len(line) > self.MAX_LINE_LENGTH:
+                yield Finding(
+                    message=f"Line too long ({len(line)} > {self.MAX_LINE_LENGTH})",
+                    severity=Severity.INFO,
+                    location=Location(file=file_path, line=line_num, column=self.MAX_LINE_LENGTH),
+                    rule_id="STY001",
+                    category="style",
+                    suggestion=f"Break this line to be under {self.MAX_LINE_LENGTH} characters",
                 )
 
-            if line_without_newline != line_without_newline.rstrip():
-                findings.add(
-                    Finding(
-                        message="Trailing whitespace",
-                        severity=Severity.HINT,
-                        location=Location(file=file_path, line=line_num, column=len(line_without_newline.rstrip())),
-                        rule_id="STY002",
-                        category="style",
-                        suggestion="Remove trailing whitespace",
-                    )
+            if not check_hints:
+                continue
+
+            # Lines carry no line endings, so only a whitespace last character can be
+            # trailing whitespace; the rstrip() copy is made just for the lines that have it
+            if line and line[-1].isspace():
+                content_length = len(line.rstrip())
+                yield Finding(
+                    message="Trailing whitespace",
+                    severity=Severity.HINT,
+                    location=Location(file=file_path, line=line_num, column=content_length),
+                    rule_id="STY002",
+                    category="style",
+                    suggestion="Remove trailing whitespace",
                 )
+                is_blank = content_length == 0
+            else:
+                is_blank = not line
 
-            if line_without_newline.strip() == "":
+            if is_blank:
                 consecutive_blank_lines += 1
                 if consecutive_blank_lines > 2:
-                    findings.add(
-                        Finding(
-                            message="Too many consecutive blank lines",
-                            severity=Severity.HINT,
-                            location=Location(file=file_path, line=line_num, column=0),
-                            rule_id="STY003",
-                            category="style",
-                            suggestion="Use at most 2 consecutive blank lines",
-                        )
+                    yield Finding(
+                        message="Too many consecutive blank lines",
+                        severity=Severity.HINT,
+                        location=Location(file=file_path, line=line_num, column=0),
+                        rule_id="STY003",
+                        category="style",
+                        suggestion="Use at most 2 consecutive blank lines",
                     )
             else:
                 consecutive_blank_lines = 0
 
-        if lines and not lines[-1].endswith("\n"):
-            findings.add(
-                Finding(
-                    message="File does not end with newline",
-                    severity=Severity.HINT,
-                    location=Location(file=file_path, line=len(lines), column=0),
-                    rule_id="STY004",
-                    category="style",
-                    suggestion="Add a newline at end of file",
-                )
+        if check_hints and source and not source.endswith("\n"):
+            yield Finding(
+                message="File does not end with newline",
+                severity=Severity.HINT,
+                location=Location(file=file_path, line=len(lines), column=0),
+                rule_id="STY004",
+                category="style",
+                suggestion="Add a newline at end of file",
             )
 
-    def _check_imports(
-        self, file_path: Path, tree: ast.AST, findings: FindingCollection
-    ) -> None:
-        imports: list[tuple[int, str, str]] = []
-
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    import_type = self._classify_import(alias.name)
-                    imports.append((node.lineno, import_type, alias.name))
-            elif isinstance(node, ast.ImportFrom):
-                if node.module:
-                    import_type = self._classify_import(node.module)
-                    imports.append((node.lineno, import_type, node.module))
-
-        imports.sort(key=lambda x: x[0])
-
-        expected_order = ["stdlib", "third_party", "local"]
-        current_group_idx = 0
-
-        for line, import_type, module in imports:
-            try:
-                type_idx = expected_order.index(import_type)
-            except ValueError:
-                continue
-
-            if type_idx < current_group_idx:
-                findings.add(
-                    Finding(
-                        message=f"Import '{module}' is out of order (expected {expected_order[current_group_idx]} imports)",
-                        severity=Severity.INFO,
-                        location=Location(file=file_path, line=line, column=0),
-                        rule_id="STY005",
-                        category="style",
-                        suggestion="Group imports: stdlib, then third-party, then local",
-                    )
-                )
-            else:
-                current_group_idx = type_idx
-
-    def _classify_import(self, module_name: str) -> str:
-        stdlib_modules = {
-            "abc", "ast", "asyncio", "base64", "collections", "contextlib",
-            "copy", "dataclasses", "datetime", "decimal", "enum", "functools",
-            "hashlib", "hmac", "html", "http", "importlib", "inspect", "io",
-            "itertools", "json", "logging", "math", "operator", "os", "pathlib",
-            "pickle", "platform", "pprint", "queue", "random", "re", "secrets",
-            "shutil", "signal", "socket", "sqlite3", "string", "subprocess",
-            "sys", "tempfile", "threading", "time", "traceback", "typing",
-            "unittest", "urllib", "uuid", "warnings", "weakref", "xml", "zipfile",
-        }
-        top_level = module_name.split(".")[0]
-        if top_level in stdlib_modules:
-            return "stdlib"
-        if top_level.startswith(".") or top_level == "review_agent":
-            return "local"
-        return "third_party"
+    def _classify_import(self, module_name: str) -> int:
+        """Return the index in _IMPORT_GROUPS of the group `module_name` belongs to."""
+        if module_name.startswith("."):
+            return _LOCAL_GROUP
+        top_level = module_name.partition(".")[0]
+        if top_level in _STDLIB_MODULES:
+            return _STDLIB_GROUP
+        if top_level == "review_agent":
+            return _LOCAL_GROUP
+        return _THIRD_PARTY_GROUP
+
+    # Each validator first tries a cheap str-method test that accepts the common,
+    # plainly conforming name; only the remaining cases reach the regex. The shortcut
+    # only agrees with the default pattern, so a subclass overriding it always gets
+    # the regex.
 
     def is_snake_case(self, name: str) -> bool:
-        return bool(self.SNAKE_CASE_PATTERN.match(name))
+        if (
+            self.SNAKE_CASE_PATTERN is StylePass.SNAKE_CASE_PATTERN
+            and name[:1].islower()
+            and name.isascii()
+            and name.islower()
+            and name.isidentifier()
+        ):
+            return True
+        return self.SNAKE_CASE_PATTERN.fullmatch(name) is not None
 
     def is_pascal_case(self, name: str) -> bool:
-        return bool(self.PASCAL_CASE_PATTERN.match(name))
+        if (
+            self.PASCAL_CASE_PATTERN is StylePass.PASCAL_CASE_PATTERN
+            and name[:1].isupper()
+            and name.isascii()
+            and name.isalnum()
+        ):
+            return True
+        return self.PASCAL_CASE_PATTERN.fullmatch(name) is not None
 
     def is_upper_case(self, name: str) -> bool:
-        return bool(self.UPPER_CASE_PATTERN.match(name))
+        if (
+            self.UPPER_CASE_PATTERN is StylePass.UPPER_CASE_PATTERN
+            and name[:1].isupper()
+            and name.isascii()
+            and name.isupper()
+            and name.isidentifier()
+        ):
+            return True
+        return self.UPPER_CASE_PATTERN.fullmatch(name) is not None
 
 
 class _StyleChecker(ast.NodeVisitor):
 
     def __init__(
-        self, file_path: Path, findings: FindingCollection, style_pass: StylePass
+        self,
+        file_path: Path,
+        findings: FindingCollection,
+        style_pass: StylePass,
+        allowed_severities: frozenset[Severity],
     ) -> None:
         self.file_path = file_path
         self.findings = findings
         self.style_pass = style_pass
+        self.allowed_severities = allowed_severities
         self._in_class = False
+        # Exact node type -> handler; skips NodeVisitor's per-node "visit_" + name getattr
+        self._dispatch: dict[type[ast.AST], Callable[[Any], None]] = {
+            ast.Module: self.visit_Module,
+            # Module-level imports are checked by visit_Module; nested ones are ignored
+            ast.Import: self._skip,
+            ast.ImportFrom: self._skip,
+            ast.ClassDef: self.visit_ClassDef,
+            ast.FunctionDef: self.visit_FunctionDef,
+            ast.AsyncFunctionDef: self.visit_AsyncFunctionDef,
+            ast.Assign: self.visit_Assign,
+            ast.AnnAssign: self.visit_AnnAssign,
+            ast.AugAssign: self.visit_AugAssign,
+            ast.For: self.visit_For,
+            ast.AsyncFor: self.visit_For,
+            ast.withitem: self.visit_withitem,
+            ast.NamedExpr: self.visit_NamedExpr,
+            ast.comprehension: self.visit_comprehension,
+            # Leaf for naming purposes: don't descend into its ctx
+            ast.Name: self._skip,
+        }
+
+    def visit(self, node: ast.AST) -> None:
+        handler = self._dispatch.get(type(node))
+        if handler is None:
+            self.generic_visit(node)
+        else:
+            handler(node)
 
     def _add_finding(
         self,
@@ -214,6 +283,8 @@ class _StyleChecker(ast.NodeVisitor):
         rule_id: str,
         suggestion: str | None = None,
     ) -> None:
+        if severity not in self.allowed_severities:
+            return
         self.findings.add(
             Finding(
                 message=message,
@@ -225,6 +296,41 @@ class _StyleChecker(ast.NodeVisitor):
             )
         )
 
+    def visit_Module(self, node: ast.Module) -> None:
+        # Import grouping (PEP 8) is about the module's import block, so STY005 looks at
+        # top-level imports only, checking each against the current group as it is reached
+        check_imports = Severity.INFO in self.allowed_severities
+        current_group_idx = 0
+        for stmt in node.body:
+            if check_imports and isinstance(stmt, (ast.Import, ast.ImportFrom)):
+                current_group_idx = self._check_import_order(stmt, current_group_idx)
+            else:
+                self.visit(stmt)
+
+    def _check_import_order(
+        self, node: ast.Import | ast.ImportFrom, current_group_idx: int
+    ) -> int:
+        if isinstance(node, ast.Import):
+            modules = [alias.name for alias in node.names]
+        else:
+            # Relative imports keep their leading dots so they classify as local
+            modules = ["." * node.level + (node.module or "")]
+
+        for module in modules:
+            type_idx = self.style_pass._classify_import(module)
+            if type_idx < current_group_idx:
+                self._add_finding(
+                    message=f"Import '{module}' is out of order (expected {_IMPORT_GROUPS[current_group_idx]} imports)",
+                    severity=Severity.INFO,
+                    line=node.lineno,
+                    column=0,
+                    rule_id="STY005",
+                    suggestion="Group imports: stdlib, then third-party, then local",
+                )
+            else:
+                current_group_idx = type_idx
+        return current_group_idx
+
     def visit_ClassDef(self, node: ast.ClassDef) -> None:
         if not self.style_pass.is_pascal_case(node.name):
             self._add_finding(
@@ -233,7 +339,7 @@ class _StyleChecker(ast.NodeVisitor):
                 line=node.lineno,
                 column=node.col_offset,
                 rule_id="STY010",
-                suggestion=f"Rename to '{self._to_pascal_case(node.name)}'",
+                suggestion=f"Rename to '{_to_pascal_case(node.name)}'",
             )
 
         old_in_class = self._in_class
@@ -264,7 +370,7 @@ class _StyleChecker(ast.NodeVisitor):
                 line=node.lineno,
                 column=node.col_offset,
                 rule_id="STY011",
-                suggestion=f"Rename to '{self._to_snake_case(node.name)}'",
+                suggestion=f"Rename to '{_to_snake_case(node.name)}'",
             )
 
         if len(node.name) > self.style_pass.MAX_FUNCTION_NAME_LENGTH:
@@ -280,8 +386,9 @@ class _StyleChecker(ast.NodeVisitor):
     def _check_argument_names(
         self, node: ast.FunctionDef | ast.AsyncFunctionDef
     ) -> None:
-        for arg in node.args.args + node.args.posonlyargs + node.args.kwonlyargs:
-            if arg.arg in ("self", "cls"):
+        args = node.args
+        for arg in chain(args.args, args.posonlyargs, args.kwonlyargs):
+            if arg.arg in _SELF_CLS_NAMES:
                 continue
             if not self.style_pass.is_snake_case(arg.arg):
                 self._add_finding(
@@ -290,40 +397,89 @@ class _StyleChecker(ast.NodeVisitor):
                     line=arg.lineno,
                     column=arg.col_offset,
                     rule_id="STY013",
-                    suggestion=f"Rename to '{self._to_snake_case(arg.arg)}'",
+                    suggestion=f"Rename to '{_to_snake_case(arg.arg)}'",
                 )
 
-    def visit_Name(self, node: ast.Name) -> None:
-        if isinstance(node.ctx, ast.Store):
-            name = node.id
-            if name.startswith("_"):
-                return
-            if name.isupper() or (name.upper() == name and "_" in name):
-                if not self.style_pass.is_upper_case(name):
-                    self._add_finding(
-                        message=f"Constant '{name}' should use UPPER_CASE",
-                        severity=Severity.INFO,
-                        line=node.lineno,
-                        column=node.col_offset,
-                        rule_id="STY014",
-                    )
-            elif not self.style_pass.is_snake_case(name) and not self.style_pass.is_upper_case(name):
-                if len(name) > 1:
-                    self._add_finding(
-                        message=f"Variable name '{name}' should use snake_case",
-                        severity=Severity.INFO,
-                        line=node.lineno,
-                        column=node.col_offset,
-                        rule_id="STY015",
-                        suggestion=f"Rename to '{self._to_snake_case(name)}'",
-                    )
+    # Variable names are checked where they are bound rather than on every ast.Name,
+    # so the far more common loads never reach a handler.
+
+    def visit_Assign(self, node: ast.Assign) -> None:
+        for target in node.targets:
+            self._check_target(target)
+        self.generic_visit(node)
+
+    def visit_AnnAssign(self, node: ast.AnnAssign) -> None:
+        self._check_target(node.target)
+        self.generic_visit(node)
+
+    def visit_AugAssign(self, node: ast.AugAssign) -> None:
+        self._check_target(node.target)
+        self.generic_visit(node)
+
+    def visit_For(self, node: ast.For | ast.AsyncFor) -> None:
+        self._check_target(node.target)
+        self.generic_visit(node)
+
+    def visit_withitem(self, node: ast.withitem) -> None:
+        if node.optional_vars is not None:
+            self._check_target(node.optional_vars)
+        self.generic_visit(node)
+
+    def visit_NamedExpr(self, node: ast.NamedExpr) -> None:
+        self._check_target(node.target)
         self.generic_visit(node)
 
-    def _to_snake_case(self, name: str) -> str:
-        result = re.sub(r"([A-Z]+)([A-Z][a-z])", r"\1_\2", name)
-        result = re.sub(r"([a-z\d])([A-Z])", r"\1_\2", result)
-        return result.lower()
+    def visit_comprehension(self, node: ast.comprehension) -> None:
+        self._check_target(node.target)
+        self.generic_visit(node)
+
+    def _check_target(self, target: ast.expr) -> None:
+        if isinstance(target, ast.Name):
+            self._check_variable_name(target)
+        elif isinstance(target, (ast.Tuple, ast.List)):
+            for elt in target.elts:
+                self._check_target(elt)
+        elif isinstance(target, ast.Starred):
+            self._check_target(target.value)
+
+    def _check_variable_name(self, node: ast.Name) -> None:
+        name = node.id
+        if name.startswith("_"):
+            return
+        if name.isupper() or (name.upper() == name and "_" in name):
+            if not self.style_pass.is_upper_case(name):
+                self._add_finding(
+                    message=f"Constant '{name}' should use UPPER_CASE",
+                    severity=Severity.INFO,
+                    line=node.lineno,
+                    column=node.col_offset,
+                    rule_id="STY014",
+                )
+        elif not self.style_pass.is_snake_case(name) and not self.style_pass.is_upper_case(name):
+            if len(name) > 1:
+                self._add_finding(
+                    message=f"Variable name '{name}' should use snake_case",
+                    severity=Severity.INFO,
+                    line=node.lineno,
+                    column=node.col_offset,
+                    rule_id="STY015",
+                    suggestion=f"Rename to '{_to_snake_case(name)}'",
+                )
+
+    def _skip(self, node: ast.AST) -> None:
+        pass
+
+
+# Rename suggestions are pure functions of the name, and the same misnamed
+# identifier is usually reported many times, so results are memoized.
+@lru_cache(maxsize=4096)
+def _to_snake_case(name: str) -> str:
+    result = _ACRONYM_BOUNDARY_PATTERN.sub(r"\1_\2", name)
+    result = _CAMEL_BOUNDARY_PATTERN.sub(r"\1_\2", result)
+    return result.lower()
+
 
-    def _to_pascal_case(self, name: str) -> str:
-        parts = name.replace("-", "_").split("_")
-        return "".join(word.capitalize() for word in parts if word)
+@lru_cache(maxsize=4096)
+def _to_pascal_case(name: str) -> str:
+    parts = name.replace("-", "_").split("_")
+    return "".join(word.capitalize() for word in parts if word)
@@ -0,0 +1,29 @@
+"""
+Optional mypyc build of the analysis passes.
+
+Metadata lives in pyproject.toml; this file only adds C extensions when
+REVIEW_AGENT_COMPILE=1 is set, so the default install stays pure Python:
+
+    pip install mypy
+    REVIEW_AGENT_COMPILE=1 pip install --no-build-isolation .
+"""
+
+import os
+
+from setuptools import setup
+
+COMPILED_MODULES = [
+    "review_agent/core/findings.py",
+    "review_agent/passes/correctness.py",
+    "review_agent/passes/performance.py",
+    "review_agent/passes/security.py",
+    "review_agent/passes/style.py",
+]
+
+ext_modules = []
+if os.environ.get("REVIEW_AGENT_COMPILE") == "1":
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify(COMPILED_MODULES, opt_level="3")
+
+setup(ext_modules=ext_modules)
@@ -1,26 +1,50 @@
 from __future__ import annotations
 
 import textwrap
+from collections.abc import Iterator
+from functools import cache
+from itertools import count
 from pathlib import Path
 
 import pytest
 
+from review_agent.__main__ import PASSES
+
+
+@pytest.fixture(scope="session")
+def passes():
+    """One instance of every pass, keyed by CLI name and shared by the whole session."""
+    return {name: pass_cls() for name, pass_cls in PASSES.items()}
+
+
+@pytest.fixture(scope="session")
+def _source_dir(tmp_path_factory: pytest.TempPathFactory) -> tuple[Path, Iterator[int]]:
+    return tmp_path_factory.mktemp("sources"), count(1)
+
 
 @pytest.fixture()
-def make_source(tmp_path: Path):
-    _counter = 0
-
-    def _make(code: str, *, filename: str | None = None) -> Path:
-        nonlocal _counter
-        _counter += 1
-        name = filename or f"test_{_counter}.py"
-        p = tmp_path / name
-        p.write_text(textwrap.dedent(code))
+def make_source(_source_dir: tuple[Path, Iterator[int]], request: pytest.FixtureRequest):
+    # Unnamed sources share one session directory under unique names, so most tests never
+    # pay for creating their own tmp_path; explicit filenames still get a per-test one
+    source_dir, counter = _source_dir
+
+    def _make(code: str, *, filename: str | None = None, dedent: bool = True) -> Path:
+        if filename is None:
+            p = source_dir / f"test_{next(counter)}.py"
+        else:
+            p = request.getfixturevalue("tmp_path") / filename
+        p.write_text(_dedent(code) if dedent else code)
         return p
 
     return _make
 
 
+# Test sources are literals, so each is dedented once per session
+@cache
+def _dedent(code: str) -> str:
+    return textwrap.dedent(code)
+
+
 def find_by_rule(findings, rule_id: str):
     return [f for f in findings if f.rule_id == rule_id]
 
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import pytest
+
+CLEAN_SOURCES = {
+    "correctness": """\
+        def add(a, b):
+            return a + b
+    """,
+    "performance": """\
+        data = [1, 2, 3]
+
+        for i, item in enumerate(data):
+            print(i, item)
+
+        doubled = [x * 2 for x in data]
+
+        smallest = min(data)
+
+        if 5 in {1, 2, 3, 4, 5}:
+            print("found")
+    """,
+    "security": """\
+        import os
+
+        name = os.getenv("USER", "default")
+
+        def greet(name):
+            return f"Hello, {name}"
+    """,
+}
+
+
+@pytest.mark.parametrize("pass_name", sorted(CLEAN_SOURCES))
+def test_no_findings(pass_name, passes, make_source):
+    path = make_source(CLEAN_SOURCES[pass_name])
+    findings = passes[pass_name].analyze(path)
+    assert len(findings) == 0
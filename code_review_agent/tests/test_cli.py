@@ -3,8 +3,8 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
-from review_agent.__main__ import main, collect_python_files, run_analysis
-from review_agent.core.findings import Severity
+from review_agent.__main__ import PARALLEL_MIN_FILES, main, collect_python_files, run_analysis
+from review_agent.core.findings import FindingCollection, Severity
 
 
 class TestCollectPythonFiles:
@@ -68,6 +68,16 @@ class TestRunAnalysis:
         for f in error_only:
             assert f.severity is Severity.ERROR
 
+    def test_parallel_matches_sequential(self, make_source):
+        paths = [
+            make_source(f'PASSWORD = "secret"\neval("{i}")\n') for i in range(PARALLEL_MIN_FILES)
+        ]
+        parallel = run_analysis(paths, ["security", "style"], Severity.HINT)
+        sequential = FindingCollection()
+        for path in paths:
+            sequential.extend(run_analysis([path], ["security", "style"], Severity.HINT))
+        assert [f.to_dict() for f in parallel] == [f.to_dict() for f in sequential]
+
 
 class TestMainCLI:
     def test_clean_file_returns_zero(self, make_source):
@@ -1,80 +1,99 @@
 from __future__ import annotations
 
-from review_agent.passes.correctness import CorrectnessPass
+import pytest
+
+from review_agent.core.source_cache import SOURCE_PATH
 from tests.conftest import find_by_rule, has_rule
 
-pass_runner = CorrectnessPass()
+
+@pytest.fixture()
+def pass_runner(passes):
+    return passes["correctness"]
 
 
 class TestCorrectnessPassProperties:
-    def test_name(self):
+    def test_name(self, pass_runner):
         assert pass_runner.name == "correctness"
 
-    def test_description(self):
+    def test_description(self, pass_runner):
         assert pass_runner.description
 
 
 class TestCOR001SyntaxError:
-    def test_syntax_error_detected(self, make_source):
+    def test_syntax_error_detected(self, pass_runner, make_source):
         path = make_source("def foo(\n")
         findings = pass_runner.analyze(path)
         assert has_rule(findings, "COR001")
         assert findings.error_count == 1
 
 
+class TestAnalyzeSource:
+    def test_matches_file_analysis(self, pass_runner, make_source):
+        code = "def f(x=[]):\n    return x == None\n"
+        path = make_source(code)
+        from_file = [f.to_dict() for f in pass_runner.analyze(path)]
+        from_text = [f.to_dict() for f in pass_runner.analyze_source(code, path)]
+        assert from_text == from_file
+
+    def test_syntax_error(self, pass_runner):
+        findings = pass_runner.analyze_source("def foo(\n")
+        (finding,) = find_by_rule(findings, "COR001")
+        assert finding.location.file == SOURCE_PATH
+
+
 class TestCOR000FileNotFound:
-    def test_missing_file(self, tmp_path):
+    def test_missing_file(self, pass_runner, tmp_path):
         path = tmp_path / "nonexistent.py"
         findings = pass_runner.analyze(path)
         assert has_rule(findings, "COR000")
 
 
 class TestCOR002NoneComparison:
-    def test_eq_none(self, make_source):
+    def test_eq_none(self, pass_runner, make_source):
         path = make_source("x = 1\nif x == None:\n    pass\n")
         findings = pass_runner.analyze(path)
         assert has_rule(findings, "COR002")
 
-    def test_neq_none(self, make_source):
+    def test_neq_none(self, pass_runner, make_source):
         path = make_source("x = 1\nif x != None:\n    pass\n")
         findings = pass_runner.analyze(path)
         assert has_rule(findings, "COR002")
 
-    def test_none_eq_x(self, make_source):
+    def test_none_eq_x(self, pass_runner, make_source):
         path = make_source("x = 1\nif None == x:\n    pass\n")
         findings = pass_runner.analyze(path)
         assert has_rule(findings, "COR002")
 
-    def test_is_none_clean(self, make_source):
+    def test_is_none_clean(self, pass_runner, make_source):
         path = make_source("x = 1\nif x is None:\n    pass\n")
         findings = pass_runner.analyze(path)
         assert not has_rule(findings, "COR002")
 
 
 class TestCOR003MutableDefaults:
-    def test_list_default(self, make_source):
+    def test_list_default(self, pass_runner, make_source):
         path = make_source("def foo(x=[]):\n    pass\n")
         findings = pass_runner.analyze(path)
         assert has_rule(findings, "COR003")
 
-    def test_dict_default(self, make_source):
+    def test_dict_default(self, pass_runner, make_source):
         path = make_source("def foo(x={}):\n    pass\n")
         findings = pass_runner.analyze(path)
         assert has_rule(findings, "COR003")
 
-    def test_set_default(self, make_source):
+    def test_set_default(self, pass_runner, make_source):
         path = make_source("def foo(x={1, 2}):\n    pass\n")
         findings = pass_runner.analyze(path)
         assert has_rule(findings, "COR003")
 
-    def test_none_default_clean(self, make_source):
+    def test_none_default_clean(self, pass_runner, make_source):
         path = make_source("def foo(x=None):\n    pass\n")
         findings = pass_runner.analyze(path)
         assert not has_rule(findings, "COR003")
 
 
 class TestCOR004UnreachableCode:
-    def test_after_return(self, make_source):
+    def test_after_return(self, pass_runner, make_source):
         path = make_source("""\
             def foo():
                 return 1
@@ -83,7 +102,7 @@ class TestCOR004UnreachableCode:
         findings = pass_runner.analyze(path)
         assert has_rule(findings, "COR004")
 
-    def test_after_raise(self, make_source):
+    def test_after_raise(self, pass_runner, make_source):
         path = make_source("""\
             def foo():
                 raise ValueError()
@@ -92,7 +111,7 @@ class TestCOR004UnreachableCode:
         findings = pass_runner.analyze(path)
         assert has_rule(findings, "COR004")
 
-    def test_no_unreachable(self, make_source):
+    def test_no_unreachable(self, pass_runner, make_source):
         path = make_source("""\
             def foo():
                 x = 1
@@ -103,7 +122,7 @@ class TestCOR004UnreachableCode:
 
 
 class TestCOR005BareExcept:
-    def test_bare_except_detected(self, make_source):
+    def test_bare_except_detected(self, pass_runner, make_source):
         path = make_source("""\
             try:
                 pass
@@ -113,7 +132,7 @@ class TestCOR005BareExcept:
         findings = pass_runner.analyze(path)
         assert has_rule(findings, "COR005")
 
-    def test_typed_except_clean(self, make_source):
+    def test_typed_except_clean(self, pass_runner, make_source):
         path = make_source("""\
             try:
                 pass
@@ -125,34 +144,24 @@ class TestCOR005BareExcept:
 
 
 class TestCOR006AlwaysTrueAssert:
-    def test_always_true(self, make_source):
+    def test_always_true(self, pass_runner, make_source):
         path = make_source('assert True\n')
         findings = pass_runner.analyze(path)
         assert has_rule(findings, "COR006")
 
-    def test_always_true_string(self, make_source):
+    def test_always_true_string(self, pass_runner, make_source):
         path = make_source('assert "nonempty"\n')
         findings = pass_runner.analyze(path)
         assert has_rule(findings, "COR006")
 
 
 class TestCOR007AlwaysFalseAssert:
-    def test_always_false(self, make_source):
+    def test_always_false(self, pass_runner, make_source):
         path = make_source("assert False\n")
         findings = pass_runner.analyze(path)
         assert has_rule(findings, "COR007")
 
-    def test_assert_zero(self, make_source):
+    def test_assert_zero(self, pass_runner, make_source):
         path = make_source("assert 0\n")
         findings = pass_runner.analyze(path)
         assert has_rule(findings, "COR007")
-
-
-class TestCleanFile:
-    def test_no_findings(self, make_source):
-        path = make_source("""\
-            def add(a, b):
-                return a + b
-        """)
-        findings = pass_runner.analyze(path)
-        assert len(findings) == 0
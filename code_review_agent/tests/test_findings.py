@@ -2,7 +2,13 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from review_agent.core.findings import Finding, FindingCollection, Location, Severity
+from review_agent.core.findings import (
+    Finding,
+    FindingCollection,
+    Location,
+    Severity,
+    severities_at_least,
+)
 
 
 class TestSeverity:
@@ -21,6 +27,15 @@ class TestSeverity:
         assert Severity("error") is Severity.ERROR
         assert Severity("hint") is Severity.HINT
 
+    def test_severities_at_least(self):
+        assert severities_at_least(Severity.ERROR) == {Severity.ERROR}
+        assert severities_at_least(Severity.INFO) == {
+            Severity.ERROR,
+            Severity.WARNING,
+            Severity.INFO,
+        }
+        assert severities_at_least(Severity.HINT) == set(Severity)
+
 
 class TestLocation:
     def test_str_format(self):
@@ -73,6 +88,11 @@ class TestFinding:
         f = self._make_finding()
         assert f.metadata == {}
 
+    def test_slotted(self):
+        f = self._make_finding()
+        assert not hasattr(f, "__dict__")
+        assert not hasattr(f.location, "__dict__")
+
 
 class TestFindingCollection:
     def _make(self, *severities: Severity) -> FindingCollection:
@@ -114,6 +134,12 @@ class TestFindingCollection:
         col.extend([f, f])
         assert len(col) == 2
 
+    def test_extend_from_collection(self):
+        src = self._make(Severity.ERROR, Severity.HINT)
+        col = FindingCollection()
+        col.extend(src)
+        assert len(col) == 2
+
     def test_error_count(self):
         col = self._make(Severity.ERROR, Severity.WARNING, Severity.ERROR)
         assert col.error_count == 2
@@ -1,34 +1,38 @@
 from __future__ import annotations
 
+import pytest
+
 from review_agent.core.findings import Severity
-from review_agent.passes.performance import PerformancePass
 from tests.conftest import find_by_rule, has_rule
 
-pass_runner = PerformancePass()
+
+@pytest.fixture()
+def pass_runner(passes):
+    return passes["performance"]
 
 
 class TestPerformancePassProperties:
-    def test_name(self):
+    def test_name(self, pass_runner):
         assert pass_runner.name == "performance"
 
-    def test_description(self):
+    def test_description(self, pass_runner):
         assert pass_runner.description
 
 
 class TestPERF000Errors:
-    def test_syntax_error(self, make_source):
+    def test_syntax_error(self, pass_runner, make_source):
         path = make_source("def foo(\n")
         findings = pass_runner.analyze(path)
         assert has_rule(findings, "PERF000")
 
-    def test_file_not_found(self, tmp_path):
+    def test_file_not_found(self, pass_runner, tmp_path):
         path = tmp_path / "missing.py"
         findings = pass_runner.analyze(path)
         assert has_rule(findings, "PERF000")
 
 
 class TestPERF001RangeLen:
-    def test_range_len_detected(self, make_source):
+    def test_range_len_detected(self, pass_runner, make_source):
         path = make_source("""\
             data = [1, 2, 3]
             for i in range(len(data)):
@@ -37,7 +41,7 @@ class TestPERF001RangeLen:
         findings = pass_runner.analyze(path)
         assert has_rule(findings, "PERF001")
 
-    def test_direct_iteration_clean(self, make_source):
+    def test_direct_iteration_clean(self, pass_runner, make_source):
         path = make_source("""\
             data = [1, 2, 3]
             for item in data:
@@ -46,7 +50,7 @@ class TestPERF001RangeLen:
         findings = pass_runner.analyze(path)
         assert not has_rule(findings, "PERF001")
 
-    def test_enumerate_clean(self, make_source):
+    def test_enumerate_clean(self, pass_runner, make_source):
         path = make_source("""\
             data = [1, 2, 3]
             for i, item in enumerate(data):
@@ -55,7 +59,7 @@ class TestPERF001RangeLen:
         findings = pass_runner.analyze(path)
         assert not has_rule(findings, "PERF001")
 
-    def test_range_with_step_clean(self, make_source):
+    def test_range_with_step_clean(self, pass_runner, make_source):
         path = make_source("""\
             for i in range(0, 10, 2):
                 print(i)
@@ -65,7 +69,7 @@ class TestPERF001RangeLen:
 
 
 class TestPERF002StringConcatInLoop:
-    def test_string_plus_eq_detected(self, make_source):
+    def test_string_plus_eq_detected(self, pass_runner, make_source):
         path = make_source("""\
             result = ""
             for item in items:
@@ -74,7 +78,7 @@ class TestPERF002StringConcatInLoop:
         findings = pass_runner.analyze(path)
         assert has_rule(findings, "PERF002")
 
-    def test_fstring_plus_eq_detected(self, make_source):
+    def test_fstring_plus_eq_detected(self, pass_runner, make_source):
         path = make_source("""\
             result = ""
             for item in items:
@@ -83,7 +87,25 @@ class TestPERF002StringConcatInLoop:
         findings = pass_runner.analyze(path)
         assert has_rule(findings, "PERF002")
 
-    def test_integer_plus_eq_clean(self, make_source):
+    def test_nested_loops_reported_once(self, pass_runner, make_source):
+        path = make_source("""\
+            result = ""
+            for row in rows:
+                for item in row:
+                    result += "x"
+        """)
+        findings = pass_runner.analyze(path)
+        assert len(find_by_rule(findings, "PERF002")) == 1
+
+    def test_outside_loop_clean(self, pass_runner, make_source):
+        path = make_source("""\
+            result = ""
+            result += "x"
+        """)
+        findings = pass_runner.analyze(path)
+        assert not has_rule(findings, "PERF002")
+
+    def test_integer_plus_eq_clean(self, pass_runner, make_source):
         path = make_source("""\
             total = 0
             for x in items:
@@ -94,7 +116,7 @@ class TestPERF002StringConcatInLoop:
 
 
 class TestPERF003AppendInLoop:
-    def test_simple_append_detected(self, make_source):
+    def test_simple_append_detected(self, pass_runner, make_source):
         path = make_source("""\
             result = []
             for item in data:
@@ -103,7 +125,7 @@ class TestPERF003AppendInLoop:
         findings = pass_runner.analyze(path)
         assert has_rule(findings, "PERF003")
 
-    def test_filtered_append_detected(self, make_source):
+    def test_filtered_append_detected(self, pass_runner, make_source):
         path = make_source("""\
             result = []
             for item in data:
@@ -113,7 +135,7 @@ class TestPERF003AppendInLoop:
         findings = pass_runner.analyze(path)
         assert has_rule(findings, "PERF003")
 
-    def test_complex_loop_body_clean(self, make_source):
+    def test_complex_loop_body_clean(self, pass_runner, make_source):
         path = make_source("""\
             result = []
             for item in data:
@@ -125,7 +147,7 @@ class TestPERF003AppendInLoop:
 
 
 class TestPERF004MembershipOnList:
-    def test_in_list_literal_detected(self, make_source):
+    def test_in_list_literal_detected(self, pass_runner, make_source):
         path = make_source("""\
             x = 1
             if x in [1, 2, 3]:
@@ -134,7 +156,7 @@ class TestPERF004MembershipOnList:
         findings = pass_runner.analyze(path)
         assert has_rule(findings, "PERF004")
 
-    def test_not_in_list_literal_detected(self, make_source):
+    def test_not_in_list_literal_detected(self, pass_runner, make_source):
         path = make_source("""\
             x = "a"
             if x not in ["a", "b", "c"]:
@@ -143,7 +165,7 @@ class TestPERF004MembershipOnList:
         findings = pass_runner.analyze(path)
         assert has_rule(findings, "PERF004")
 
-    def test_in_set_literal_clean(self, make_source):
+    def test_in_set_literal_clean(self, pass_runner, make_source):
         path = make_source("""\
             x = 1
             if x in {1, 2, 3}:
@@ -152,7 +174,7 @@ class TestPERF004MembershipOnList:
         findings = pass_runner.analyze(path)
         assert not has_rule(findings, "PERF004")
 
-    def test_short_list_ignored(self, make_source):
+    def test_short_list_ignored(self, pass_runner, make_source):
         path = make_source("""\
             x = 1
             if x in [1, 2]:
@@ -163,34 +185,34 @@ class TestPERF004MembershipOnList:
 
 
 class TestPERF005ConstructorVsLiteral:
-    def test_dict_constructor(self, make_source):
+    def test_dict_constructor(self, pass_runner, make_source):
         path = make_source("x = dict()\n")
         findings = pass_runner.analyze(path)
         assert has_rule(findings, "PERF005")
 
-    def test_list_constructor(self, make_source):
+    def test_list_constructor(self, pass_runner, make_source):
         path = make_source("x = list()\n")
         findings = pass_runner.analyze(path)
         assert has_rule(findings, "PERF005")
 
-    def test_tuple_constructor(self, make_source):
+    def test_tuple_constructor(self, pass_runner, make_source):
         path = make_source("x = tuple()\n")
         findings = pass_runner.analyze(path)
         assert has_rule(findings, "PERF005")
 
-    def test_dict_literal_clean(self, make_source):
+    def test_dict_literal_clean(self, pass_runner, make_source):
         path = make_source("x = {}\n")
         findings = pass_runner.analyze(path)
         assert not has_rule(findings, "PERF005")
 
-    def test_constructor_with_args_clean(self, make_source):
+    def test_constructor_with_args_clean(self, pass_runner, make_source):
         path = make_source("x = list(range(10))\n")
         findings = pass_runner.analyze(path)
         assert not has_rule(findings, "PERF005")
 
 
 class TestPERF006SortedMinMax:
-    def test_sorted_first_element(self, make_source):
+    def test_sorted_first_element(self, pass_runner, make_source):
         path = make_source("""\
             data = [3, 1, 2]
             smallest = sorted(data)[0]
@@ -200,7 +222,7 @@ class TestPERF006SortedMinMax:
         match = find_by_rule(findings, "PERF006")[0]
         assert "min" in match.suggestion
 
-    def test_sorted_last_element(self, make_source):
+    def test_sorted_last_element(self, pass_runner, make_source):
         path = make_source("""\
             data = [3, 1, 2]
             largest = sorted(data)[-1]
@@ -210,7 +232,7 @@ class TestPERF006SortedMinMax:
         match = find_by_rule(findings, "PERF006")[0]
         assert "max" in match.suggestion
 
-    def test_sorted_middle_element_clean(self, make_source):
+    def test_sorted_middle_element_clean(self, pass_runner, make_source):
         path = make_source("""\
             data = [3, 1, 2]
             median = sorted(data)[1]
@@ -218,29 +240,10 @@ class TestPERF006SortedMinMax:
         findings = pass_runner.analyze(path)
         assert not has_rule(findings, "PERF006")
 
-    def test_plain_sorted_clean(self, make_source):
+    def test_plain_sorted_clean(self, pass_runner, make_source):
         path = make_source("""\
             data = [3, 1, 2]
             ordered = sorted(data)
         """)
         findings = pass_runner.analyze(path)
         assert not has_rule(findings, "PERF006")
-
-
-class TestCleanFile:
-    def test_no_findings(self, make_source):
-        path = make_source("""\
-            data = [1, 2, 3]
-
-            for i, item in enumerate(data):
-                print(i, item)
-
-            doubled = [x * 2 for x in data]
-
-            smallest = min(data)
-
-            if 5 in {1, 2, 3, 4, 5}:
-                print("found")
-        """)
-        findings = pass_runner.analyze(path)
-        assert len(findings) == 0
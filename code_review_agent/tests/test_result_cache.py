@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import pytest
+
+from review_agent.core.findings import Severity
+from review_agent.core.result_cache import clear_result_cache
+from review_agent.passes.style import StylePass
+from tests.conftest import find_by_rule
+
+
+@pytest.fixture()
+def pass_runner(passes):
+    return passes["security"]
+
+
+class TestCachedAnalysis:
+    def setup_method(self):
+        clear_result_cache()
+
+    def test_duplicate_content_relocated(self, pass_runner, tmp_path):
+        first = tmp_path / "a.py"
+        second = tmp_path / "b.py"
+        first.write_text("eval(x)\n")
+        second.write_text("eval(x)\n")
+        pass_runner.analyze(first)
+        (finding,) = find_by_rule(pass_runner.analyze(second), "SEC001")
+        assert finding.location.file == second
+
+    def test_hits_are_fresh_copies(self, pass_runner, make_source):
+        path = make_source("eval(x)\n")
+        first = list(pass_runner.analyze(path))
+        first[0].metadata["seen"] = "yes"
+        second = list(pass_runner.analyze(path))
+        assert second[0] is not first[0]
+        assert "seen" not in second[0].metadata
+
+    def test_keyed_by_pass_and_severity(self, passes, make_source):
+        path = make_source("eval(x)   \n")
+        assert find_by_rule(passes["security"].analyze(path), "SEC001")
+        assert find_by_rule(passes["style"].analyze(path), "STY002")
+        assert not find_by_rule(passes["style"].analyze(path, Severity.WARNING), "STY002")
+
+    def test_edited_file_reanalyzed(self, pass_runner, make_source):
+        path = make_source("eval(x)\n")
+        assert find_by_rule(pass_runner.analyze(path), "SEC001")
+        path.write_text("x = 1\n")
+        assert not find_by_rule(pass_runner.analyze(path), "SEC001")
+
+    def test_keyed_by_pass_settings(self, make_source):
+        class StrictStylePass(StylePass):
+            MAX_LINE_LENGTH = 80
+
+        path = make_source(f"x = '{'a' * 80}'\n")
+        assert not find_by_rule(StylePass().analyze(path), "STY001")
+        assert find_by_rule(StrictStylePass().analyze(path), "STY001")
+
+        reconfigured = StylePass()
+        reconfigured.MAX_LINE_LENGTH = 80
+        assert find_by_rule(reconfigured.analyze(path), "STY001")
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import pytest
+
+from review_agent.core.source_cache import MMAP_THRESHOLD, load_source, parse_source
+
+
+class TestLoadSource:
+    def test_parses_source(self, make_source):
+        path = make_source("x = 1\ny = 2\n")
+        parsed = load_source(path)
+        assert parsed.source == "x = 1\ny = 2\n"
+        assert parsed.lines == ("x = 1", "y = 2")
+        assert parsed.tree is not None
+        assert parsed.syntax_error is None
+
+    def test_reused_while_unchanged(self, make_source):
+        path = make_source("x = 1\n")
+        assert load_source(path) is load_source(path)
+
+    def test_reloaded_after_change(self, make_source):
+        path = make_source("x = 1\n")
+        first = load_source(path)
+        path.write_text("x = 22\n")
+        second = load_source(path)
+        assert second is not first
+        assert second.source == "x = 22\n"
+
+    def test_large_file(self, make_source):
+        code = "x = 1\n" * (MMAP_THRESHOLD // 6 + 1)
+        path = make_source(code)
+        parsed = load_source(path)
+        assert parsed.source == code
+        assert parsed.tree is not None
+
+    def test_syntax_error_cached(self, make_source):
+        path = make_source("def foo(\n")
+        parsed = load_source(path)
+        assert parsed.tree is None
+        assert parsed.lines == ("def foo(",)
+        with pytest.raises(SyntaxError):
+            parsed.require_tree()
+
+    def test_shared_across_identical_files(self, make_source):
+        first = make_source("x = 1\n")
+        second = make_source("x = 1\n")
+        assert load_source(first).tree is load_source(second).tree
+
+    def test_missing_file(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            load_source(tmp_path / "missing.py")
+
+
+class TestParseSource:
+    def test_parses_text(self):
+        parsed = parse_source("x = 1\n")
+        assert parsed.lines == ("x = 1",)
+        assert parsed.tree is not None
+
+    def test_reused_for_same_text(self):
+        assert parse_source("y = 2\n") is parse_source("y = 2\n")
+
+    def test_syntax_error(self):
+        parsed = parse_source("def foo(\n")
+        with pytest.raises(SyntaxError):
+            parsed.require_tree()
@@ -1,67 +1,133 @@
 from __future__ import annotations
 
+import re
+
+import pytest
+
+from review_agent.core.findings import Severity
 from review_agent.passes.style import StylePass
 from tests.conftest import find_by_rule, has_rule
 
-pass_runner = StylePass()
+
+@pytest.fixture()
+def pass_runner(passes):
+    return passes["style"]
 
 
 class TestStylePassProperties:
-    def test_name(self):
+    def test_name(self, pass_runner):
         assert pass_runner.name == "style"
 
-    def test_description(self):
+    def test_description(self, pass_runner):
         assert pass_runner.description
 
 
+class TestNameValidators:
+    def test_snake_case(self, pass_runner):
+        assert pass_runner.is_snake_case("max_len2")
+        assert pass_runner.is_snake_case("__private")
+        assert not pass_runner.is_snake_case("myVar")
+        assert not pass_runner.is_snake_case("___x")
+        assert not pass_runner.is_snake_case("café")
+        assert not pass_runner.is_snake_case("_x\n")
+
+    def test_pascal_case(self, pass_runner):
+        assert pass_runner.is_pascal_case("HTTPServer2")
+        assert pass_runner.is_pascal_case("_Private")
+        assert not pass_runner.is_pascal_case("My_Class")
+        assert not pass_runner.is_pascal_case("myClass")
+
+    def test_upper_case(self, pass_runner):
+        assert pass_runner.is_upper_case("MAX_SIZE")
+        assert pass_runner.is_upper_case("__ALL__")
+        assert not pass_runner.is_upper_case("Max_Size")
+        assert not pass_runner.is_upper_case("_1")
+
+    def test_subclass_pattern_override(self):
+        class NoUnderscoreStylePass(StylePass):
+            SNAKE_CASE_PATTERN = re.compile(r"[a-z][a-z0-9]*")
+
+        assert NoUnderscoreStylePass().is_snake_case("maxlen")
+        assert not NoUnderscoreStylePass().is_snake_case("max_len")
+
+
+class TestMinSeverity:
+    def test_filtered_at_source(self, pass_runner, make_source):
+        path = make_source("x = " + "a" * 100 + "   \n\n\n\nmyVar = 1")
+        findings = pass_runner.analyze(path, Severity.WARNING)
+        assert len(findings) == 0
+
+    def test_warnings_kept(self, pass_runner, make_source):
+        path = make_source("class my_class:\n    pass\n")
+        findings = pass_runner.analyze(path, Severity.WARNING)
+        assert has_rule(findings, "STY010")
+
+
+class TestAnalyzeSource:
+    def test_line_and_name_rules(self, pass_runner):
+        findings = pass_runner.analyze_source("myVar = 1   ")
+        for rule_id in ("STY002", "STY004", "STY015"):
+            assert has_rule(findings, rule_id)
+
+
 class TestSTY000FileNotFound:
-    def test_missing_file(self, tmp_path):
+    def test_missing_file(self, pass_runner, tmp_path):
         path = tmp_path / "nonexistent.py"
         findings = pass_runner.analyze(path)
         assert has_rule(findings, "STY000")
 
 
 class TestSTY001LineTooLong:
-    def test_long_line_detected(self, make_source):
+    def test_long_line_detected(self, pass_runner, make_source):
         long_line = "x = " + "a" * 100 + "\n"
         path = make_source(long_line)
         findings = pass_runner.analyze(path)
         assert has_rule(findings, "STY001")
 
-    def test_short_line_clean(self, make_source):
+    def test_short_line_clean(self, pass_runner, make_source):
         path = make_source("x = 1\n")
         findings = pass_runner.analyze(path)
         assert not has_rule(findings, "STY001")
 
 
 class TestSTY002TrailingWhitespace:
-    def test_trailing_space(self, make_source):
+    def test_trailing_space(self, pass_runner, make_source):
         path = make_source("x = 1   \n")
         findings = pass_runner.analyze(path)
         assert has_rule(findings, "STY002")
 
+    def test_location_per_line(self, pass_runner, make_source):
+        path = make_source("x = 1\ny = 2 \t\nz = 3\n\tw = 4  ")
+        found = find_by_rule(pass_runner.analyze(path), "STY002")
+        assert [(f.location.line, f.location.column) for f in found] == [(2, 5), (4, 6)]
+
+    def test_clean_lines(self, pass_runner, make_source):
+        path = make_source("x = 1\ny = 2\n")
+        findings = pass_runner.analyze(path)
+        assert not has_rule(findings, "STY002")
+
 
 class TestSTY003ConsecutiveBlankLines:
-    def test_too_many_blanks(self, make_source):
+    def test_too_many_blanks(self, pass_runner, make_source):
         path = make_source("x = 1\n\n\n\ny = 2\n")
         findings = pass_runner.analyze(path)
         assert has_rule(findings, "STY003")
 
-    def test_two_blanks_clean(self, make_source):
+    def test_two_blanks_clean(self, pass_runner, make_source):
         path = make_source("x = 1\n\n\ny = 2\n")
         findings = pass_runner.analyze(path)
         assert not has_rule(findings, "STY003")
 
 
 class TestSTY004NoNewlineAtEOF:
-    def test_missing_newline(self, make_source):
+    def test_missing_newline(self, pass_runner, make_source):
         path = make_source("x = 1")
         findings = pass_runner.analyze(path)
         assert has_rule(findings, "STY004")
 
 
 class TestSTY005ImportOrdering:
-    def test_out_of_order_imports(self, make_source):
+    def test_out_of_order_imports(self, pass_runner, make_source):
         path = make_source("""\
             from review_agent.core import findings
             import os
@@ -69,7 +135,7 @@ class TestSTY005ImportOrdering:
         findings = pass_runner.analyze(path)
         assert has_rule(findings, "STY005")
 
-    def test_correct_order_clean(self, make_source):
+    def test_correct_order_clean(self, pass_runner, make_source):
         path = make_source("""\
             import os
             import sys
@@ -77,38 +143,79 @@ class TestSTY005ImportOrdering:
         findings = pass_runner.analyze(path)
         assert not has_rule(findings, "STY005")
 
+    def test_function_level_imports_ignored(self, pass_runner, make_source):
+        path = make_source("""\
+            import requests
+
+            def load():
+                import json
+                return json
+        """)
+        findings = pass_runner.analyze(path)
+        assert not has_rule(findings, "STY005")
+
+    def test_relative_import_is_local(self, pass_runner, make_source):
+        path = make_source("""\
+            from . import helpers
+            import requests
+        """)
+        findings = pass_runner.analyze(path)
+        (finding,) = find_by_rule(findings, "STY005")
+        assert "'requests'" in finding.message
+
+    def test_interpreter_stdlib_module_recognized(self, pass_runner, make_source):
+        path = make_source("""\
+            import requests
+            import argparse
+        """)
+        findings = pass_runner.analyze(path)
+        assert has_rule(findings, "STY005")
+
+    def test_interpreter_stdlib_module_before_third_party_clean(self, pass_runner, make_source):
+        path = make_source("""\
+            import argparse
+            import requests
+        """)
+        findings = pass_runner.analyze(path)
+        assert not has_rule(findings, "STY005")
+
 
 class TestSTY010ClassName:
-    def test_snake_case_class(self, make_source):
+    def test_snake_case_class(self, pass_runner, make_source):
         path = make_source("class my_class:\n    pass\n")
         findings = pass_runner.analyze(path)
         assert has_rule(findings, "STY010")
 
-    def test_pascal_case_clean(self, make_source):
+    def test_pascal_case_clean(self, pass_runner, make_source):
         path = make_source("class MyClass:\n    pass\n")
         findings = pass_runner.analyze(path)
         assert not has_rule(findings, "STY010")
 
 
 class TestSTY011FunctionName:
-    def test_camel_case_function(self, make_source):
+    def test_camel_case_function(self, pass_runner, make_source):
         path = make_source("def myFunction():\n    pass\n")
         findings = pass_runner.analyze(path)
         assert has_rule(findings, "STY011")
 
-    def test_snake_case_clean(self, make_source):
+    def test_rename_suggestion(self, pass_runner, make_source):
+        path = make_source("def parseHTTPResponse():\n    pass\n")
+        (finding,) = find_by_rule(pass_runner.analyze(path), "STY011")
+        assert finding.suggestion == "Rename to 'parse_http_response'"
+
+    def test_snake_case_clean(self, pass_runner, make_source):
         path = make_source("def my_function():\n    pass\n")
         findings = pass_runner.analyze(path)
         assert not has_rule(findings, "STY011")
 
-    def test_dunder_methods_ignored(self, make_source):
+    def test_dunder_methods_ignored(self, pass_runner, make_source):
         path = make_source("class Foo:\n    def __init__(self):\n        pass\n")
         findings = pass_runner.analyze(path)
         assert not has_rule(findings, "STY011")
 
 
 class TestSTY012FunctionNameTooLong:
-    def test_very_long_name(self, make_source):
+    def test_very_long_name(self, pass_runner, make_source):
         long_name = "a" * 41
         path = make_source(f"def {long_name}():\n    pass\n")
         findings = pass_runner.analyze(path)
@@ -116,29 +223,43 @@ class TestSTY012FunctionNameTooLong:
 
 
 class TestSTY013ArgumentName:
-    def test_camel_case_arg(self, make_source):
+    def test_camel_case_arg(self, pass_runner, make_source):
         path = make_source("def foo(myArg):\n    pass\n")
         findings = pass_runner.analyze(path)
         assert has_rule(findings, "STY013")
 
-    def test_self_cls_ignored(self, make_source):
+    def test_self_cls_ignored(self, pass_runner, make_source):
         path = make_source("class A:\n    def foo(self, cls):\n        pass\n")
         findings = pass_runner.analyze(path)
         assert not has_rule(findings, "STY013")
 
 
 class TestSTY015VariableName:
-    def test_camel_case_variable(self, make_source):
+    def test_camel_case_variable(self, pass_runner, make_source):
         path = make_source("myVariable = 1\n")
         findings = pass_runner.analyze(path)
         assert has_rule(findings, "STY015")
 
-    def test_snake_case_clean(self, make_source):
+    def test_snake_case_clean(self, pass_runner, make_source):
         path = make_source("my_variable = 1\n")
         findings = pass_runner.analyze(path)
         assert not has_rule(findings, "STY015")
 
-    def test_single_char_ignored(self, make_source):
+    def test_single_char_ignored(self, pass_runner, make_source):
         path = make_source("x = 1\n")
         findings = pass_runner.analyze(path)
         assert not has_rule(findings, "STY015")
+
+    def test_unpacking_and_loop_targets(self, pass_runner, make_source):
+        path = make_source("""\
+            first, (secondVal, *restItems) = data
+            for loopVar in items:
+                pass
+        """)
+        found = find_by_rule(pass_runner.analyze(path), "STY015")
+        assert {f.message.split("'")[1] for f in found} == {"secondVal", "restItems", "loopVar"}
+
+    def test_loaded_names_ignored(self, pass_runner, make_source):
+        path = make_source("print(someName)\n")
+        findings = pass_runner.analyze(path)
+        assert not has_rule(findings, "STY015")
@@ -7,7 +7,6 @@ import sys
 
 from loguru import logger
 
-from src.coordinator import CoordinatorAgent
 from src.models import Question
 
 
@@ -21,6 +20,10 @@ async def main():
 
     logger.info("Starting Multi-Agent Collaboration System")
 
+    # Imported here: the agents pull in the anthropic SDK, by far the slowest import,
+    # so `import main` stays cheap and the startup log appears before it loads
+    from src.coordinator import CoordinatorAgent
+
     # Initialize the coordinator
     coordinator = CoordinatorAgent()
 
@@ -5,28 +5,57 @@ Base agent class for the multi-agent system.
 import os
 import re
 from abc import ABC, abstractmethod
+from typing import Any
 
-from anthropic import Anthropic
+from anthropic import AsyncAnthropic
+from anthropic.types import Usage
 
 from src.config import AgentConfig
 from src.models import AgentMessage, Source, SourceType
 
+# Source-extraction patterns, compiled once for every response parsed
+_SOURCE_TAG_RE = re.compile(r"\[Source:\s*([^\]]+)\]", re.IGNORECASE)
+_SOURCE_TAG_URL_RE = re.compile(r"https?://[^\s\])]+")
+_STANDALONE_URL_RE = re.compile(r"https?://[^\s\)\]]+(?:\.[^\s\)\]]+)?")
+_CITATION_RE = re.compile(r"\(([A-Z][a-z]+(?:\s+et\s+al\.?)?,\s*\d{4})\)")
+_SENTENCE_BREAK_RE = re.compile(r"[.!?]\s+")
+
+
+def create_client() -> AsyncAnthropic:
+    """Create an async Anthropic client from ANTHROPIC_API_KEY."""
+    api_key = os.getenv("ANTHROPIC_API_KEY")
+    if not api_key:
+        raise ValueError("ANTHROPIC_API_KEY not found in environment variables")
+
+    return AsyncAnthropic(api_key=api_key)
+
 
 class BaseAgent(ABC):
     """Base class for all agents in the system."""
 
-    def __init__(self, config: AgentConfig):
-        """Initialize the agent with configuration."""
+    # Static role instructions, sent as a cacheable system prompt on every request
+    SYSTEM_PROMPT: str
+
+    def __init__(self, config: AgentConfig, client: AsyncAnthropic | None = None):
+        """
+        Initialize the agent with configuration.
+
+        Args:
+            config: The agent's configuration
+            client: Optional client to share with other agents; one is created from
+                ANTHROPIC_API_KEY if not given
+        """
         self.config = config
         self.name = config.name
         self.role = config.role
 
-        # Initialize the Anthropic client
-        api_key = os.getenv("ANTHROPIC_API_KEY")
-        if not api_key:
-            raise ValueError("ANTHROPIC_API_KEY not found in environment variables")
+        # Async client so LLM calls don't block the event loop
+        self.client = client if client is not None else create_client()
 
-        self.client = Anthropic(api_key=api_key)
+        # The instructions are identical across requests, so the API can reuse their prefill
+        self._system = [
+            {"type": "text", "text": self.SYSTEM_PROMPT, "cache_control": {"type": "ephemeral"}}
+        ]
 
     async def process(
         self, input_text: str, context: list[AgentMessage] | None = None
@@ -45,15 +74,17 @@ class BaseAgent(ABC):
         prompt = self._build_prompt(input_text, context)
 
         # Get response from the LLM
-        response_text, sources = await self._get_llm_response(prompt)
+        response_text, sources, usage = await self._get_llm_response(prompt)
 
         # Create and return the agent message
-        return AgentMessage(agent_name=self.name, content=response_text, sources=sources)
+        return AgentMessage(
+            agent_name=self.name, content=response_text, sources=sources, metadata=usage
+        )
 
     @abstractmethod
     def _build_prompt(self, input_text: str, context: list[AgentMessage] | None = None) -> str:
         """
-        Build the prompt for the LLM based on the agent's role.
+        Build the user prompt for the LLM; the role instructions live in SYSTEM_PROMPT.
 
         Args:
             input_text: The input text
@@ -64,7 +95,7 @@ class BaseAgent(ABC):
         """
         pass
 
-    async def _get_llm_response(self, prompt: str) -> tuple[str, list[Source]]:
+    async def _get_llm_response(self, prompt: str) -> tuple[str, list[Source], dict[str, Any]]:
         """
         Get response from the LLM.
 
@@ -72,26 +103,68 @@ class BaseAgent(ABC):
             prompt: The prompt to send to the LLM
 
         Returns:
-            Tuple of (response_text, sources)
+            Tuple of (response_text, sources, token usage)
         """
         try:
-            message = self.client.messages.create(
-                model=self.config.model,
-                max_tokens=self.config.max_tokens,
-                temperature=self.config.temperature,
-                messages=[{"role": "user", "content": prompt}],
-            )
+            message = await self.client.messages.create(**self._request_params(prompt))
 
             response_text = message.content[0].text
 
             # Extract sources from response (placeholder - can be enhanced)
             sources = self._extract_sources(response_text)
 
-            return response_text, sources
+            return response_text, sources, self._usage_metadata(message.usage)
 
         except Exception as e:
             raise Exception(f"Error calling LLM: {str(e)}")
 
+    def batch_request(
+        self, custom_id: str, input_text: str, context: list[AgentMessage] | None = None
+    ) -> dict[str, Any]:
+        """
+        Build a Message Batches API request for the call process() would make.
+
+        Args:
+            custom_id: Identifier that the batch results are matched back by
+            input_text: The input text to process
+            context: Optional list of previous agent messages for context
+
+        Returns:
+            The batch request entry
+        """
+        prompt = self._build_prompt(input_text, context)
+        return {"custom_id": custom_id, "params": self._request_params(prompt)}
+
+    def message_from_response(self, message: Any) -> AgentMessage:
+        """Turn an LLM response obtained outside process() (e.g. a batch result) into a message."""
+        response_text = message.content[0].text
+        return AgentMessage(
+            agent_name=self.name,
+            content=response_text,
+            sources=self._extract_sources(response_text),
+            metadata=self._usage_metadata(message.usage),
+        )
+
+    def _request_params(self, prompt: str) -> dict[str, Any]:
+        """Messages API parameters for sending `prompt` to this agent's model."""
+        return {
+            "model": self.config.model,
+            "max_tokens": self.config.max_tokens,
+            "temperature": self.config.temperature,
+            "system": self._system,
+            "messages": [{"role": "user", "content": prompt}],
+        }
+
+    @staticmethod
+    def _usage_metadata(usage: Usage) -> dict[str, Any]:
+        """Token usage of a response, including how much of the prompt was served from cache."""
+        return {
+            "input_tokens": usage.input_tokens,
+            "output_tokens": usage.output_tokens,
+            "cache_creation_input_tokens": usage.cache_creation_input_tokens or 0,
+            "cache_read_input_tokens": usage.cache_read_input_tokens or 0,
+        }
+
     def _extract_sources(self, text: str) -> list[Source]:
         """
         Extract sources from the response text.
@@ -103,70 +176,71 @@ class BaseAgent(ABC):
         Returns:
             List of extracted sources
         """
-        sources = []
-        seen_urls = set()
-
-        # Pattern 1: [Source: description] format
-        source_pattern = r"\[Source:\s*([^\]]+)\]"
-        matches = re.finditer(source_pattern, text, re.IGNORECASE)
-
-        for match in matches:
-            source_text = match.group(1).strip()
-
-            # Check if it contains a URL
-            url_pattern = r"https?://[^\s\])]+"
-            url_match = re.search(url_pattern, source_text)
-
-            url = url_match.group(0) if url_match else None
-            if url:
-                seen_urls.add(url)
-
-            source = Source(
-                title=(
-                    source_text
-                    if not url_match
-                    else source_text.split("http")[0].strip() or source_text
-                ),
-                url=url,
-                source_type=SourceType.WEB if url_match else SourceType.DERIVED,
-                content_snippet=None,
-            )
-            sources.append(source)
+        sources: list[Source] = []
+        seen_urls: set[str] = set()
 
-        # Pattern 2: Look for URLs in parentheses or standalone
-        # Skip URLs already found in [Source: ...] tags
-        url_pattern = r"https?://[^\s\)\]]+(?:\.[^\s\)\]]+)?"
-        url_matches = re.finditer(url_pattern, text)
+        # Each pattern needs a literal marker, so a cheap substring check skips
+        # the regex scans on the common case of a response with no citations
+        has_url = "http" in text
+        if not has_url and "[" not in text and "(" not in text:
+            return sources
 
-        for match in url_matches:
-            url = match.group(0).rstrip(".,;:")
-            if url not in seen_urls and "." in url:  # Ensure it's a valid URL and not duplicate
-                seen_urls.add(url)
+        # Pattern 1: [Source: description] format
+        if "[" in text:
+            for match in _SOURCE_TAG_RE.finditer(text):
+                source_text = match.group(1).strip()
 
-                # Try to find surrounding context for title
-                start = max(0, match.start() - 100)
-                end = min(len(text), match.end() + 50)
-                context = text[start:end]
+                # Check if it contains a URL
+                url_match = _SOURCE_TAG_URL_RE.search(source_text)
 
-                # Extract a simple title from context
-                title = self._extract_title_from_context(context, url)
+                url = url_match.group(0) if url_match else None
+                if url:
+                    seen_urls.add(url)
 
                 source = Source(
-                    title=title,
+                    title=(
+                        source_text
+                        if not url_match
+                        else source_text.split("http")[0].strip() or source_text
+                    ),
                     url=url,
-                    source_type=SourceType.WEB,
-                    content_snippet=context[:100] if len(context) > 100 else context,
+                    source_type=SourceType.WEB if url_match else SourceType.DERIVED,
+                    content_snippet=None,
                 )
                 sources.append(source)
 
-        # Pattern 3: Look for academic citations like (Author, Year)
-        citation_pattern = r"\(([A-Z][a-z]+(?:\s+et\s+al\.?)?,\s*\d{4})\)"
-        citation_matches = re.finditer(citation_pattern, text)
+        # Pattern 2: Look for URLs in parentheses or standalone
+        # Skip URLs already found in [Source: ...] tags
+        if has_url:
+            for match in _STANDALONE_URL_RE.finditer(text):
+                url = match.group(0).rstrip(".,;:")
+                if url not in seen_urls and "." in url:  # Ensure it's a valid URL and not duplicate
+                    seen_urls.add(url)
+
+                    # Try to find surrounding context for title
+                    start = max(0, match.start() - 100)
+                    end = min(len(text), match.end() + 50)
+                    context = text[start:end]
+
+                    # Extract a simple title from context
+                    title = self._extract_title_from_context(context, url)
+
+                    source = Source(
+                        title=title,
+                        url=url,
+                        source_type=SourceType.WEB,
+                        content_snippet=context[:100] if len(context) > 100 else context,
+                    )
+                    sources.append(source)
 
-        for match in citation_matches:
-            citation = match.group(1)
-            source = Source(title=citation, source_type=SourceType.RESEARCH, content_snippet=None)
-            sources.append(source)
+        # Pattern 3: Look for academic citations like (Author, Year)
+        if "(" in text:
+            for match in _CITATION_RE.finditer(text):
+                citation = match.group(1)
+                source = Source(
+                    title=citation, source_type=SourceType.RESEARCH, content_snippet=None
+                )
+                sources.append(source)
 
         return sources
 
@@ -185,12 +259,12 @@ class BaseAgent(ABC):
         context_clean = context.replace(url, "").strip()
 
         # Look for sentences before the URL
-        sentences = re.split(r"[.!?]\s+", context_clean)
+        sentences = _SENTENCE_BREAK_RE.split(context_clean)
         if sentences:
             # Get the last sentence before URL or first after
             title = sentences[-1] if sentences[-1] else sentences[0] if len(sentences) > 1 else url
             # Clean and truncate
-            title = re.sub(r"\s+", " ", title).strip()
+            title = " ".join(title.split())
             if len(title) > 100:
                 title = title[:97] + "..."
             return title if title else url
@@ -9,14 +9,9 @@ from src.models import AgentMessage
 class FactCheckerAgent(BaseAgent):
     """Agent responsible for fact-checking and validating information."""
 
-    def _build_prompt(self, input_text: str, context: list[AgentMessage] | None = None) -> str:
-        """Build the fact-checking prompt."""
-
-        base_prompt = f"""You are a fact-checker agent. Your role is to verify the accuracy of information
+    SYSTEM_PROMPT = """You are a fact-checker agent. Your role is to verify the accuracy of information
 and validate sources. Be critical and thorough in your assessment.
 
-Question/Claim to verify: {input_text}
-
 Instructions:
 1. Identify key claims that need verification
 2. Assess the credibility and reliability of sources
@@ -27,14 +22,17 @@ Instructions:
 
 Provide a detailed fact-check analysis."""
 
+    def _build_prompt(self, input_text: str, context: list[AgentMessage] | None = None) -> str:
+        """Build the fact-checking prompt."""
+
+        parts = [f"Question/Claim to verify: {input_text}"]
+
         if context:
-            context_text = "\n\nInformation to verify:\n"
+            parts.append("\n\nInformation to verify:\n")
             for msg in context:
-                context_text += f"\n{msg.agent_name}:\n{msg.content}\n"
+                parts.append(f"\n{msg.agent_name}:\n{msg.content}\n")
                 if msg.sources:
-                    context_text += "Sources:\n"
-                    for source in msg.sources:
-                        context_text += f"- {source.title}\n"
-            base_prompt += context_text
+                    parts.append("Sources:\n")
+                    parts.extend(f"- {source.title}\n" for source in msg.sources)
 
-        return base_prompt
+        return "".join(parts)
@@ -9,14 +9,9 @@ from src.models import AgentMessage
 class ResearcherAgent(BaseAgent):
     """Agent responsible for conducting research and gathering information."""
 
-    def _build_prompt(self, input_text: str, context: list[AgentMessage] | None = None) -> str:
-        """Build the research prompt."""
-
-        base_prompt = f"""You are a research agent. Your role is to gather comprehensive information
+    SYSTEM_PROMPT = """You are a research agent. Your role is to gather comprehensive information
 about the given question. Focus on finding accurate, relevant information from multiple perspectives.
 
-Question: {input_text}
-
 Instructions:
 1. Identify key concepts and topics in the question
 2. Consider multiple angles and perspectives
@@ -26,10 +21,14 @@ Instructions:
 
 Provide a comprehensive research summary with sources."""
 
+    def _build_prompt(self, input_text: str, context: list[AgentMessage] | None = None) -> str:
+        """Build the research prompt."""
+
+        parts = [f"Question: {input_text}"]
+
         if context:
-            context_text = "\n\nContext from other agents:\n"
+            parts.append("\n\nContext from other agents:\n")
             for msg in context:
-                context_text += f"\n{msg.agent_name}: {msg.content}\n"
-            base_prompt += context_text
+                parts.append(f"\n{msg.agent_name}: {msg.content}\n")
 
-        return base_prompt
+        return "".join(parts)
@@ -9,14 +9,9 @@ from src.models import AgentMessage
 class SynthesizerAgent(BaseAgent):
     """Agent responsible for synthesizing information into coherent answers."""
 
-    def _build_prompt(self, input_text: str, context: list[AgentMessage] | None = None) -> str:
-        """Build the synthesis prompt."""
-
-        base_prompt = f"""You are a synthesizer agent. Your role is to combine information from multiple
+    SYSTEM_PROMPT = """You are a synthesizer agent. Your role is to combine information from multiple
 sources into a clear, coherent, and well-structured answer.
 
-Question: {input_text}
-
 Instructions:
 1. Integrate information from all available sources
 2. Resolve any contradictions or inconsistencies
@@ -28,14 +23,17 @@ Instructions:
 
 Provide a well-reasoned, synthesized answer."""
 
+    def _build_prompt(self, input_text: str, context: list[AgentMessage] | None = None) -> str:
+        """Build the synthesis prompt."""
+
+        parts = [f"Question: {input_text}"]
+
         if context:
-            context_text = "\n\nInformation to synthesize:\n"
+            parts.append("\n\nInformation to synthesize:\n")
             for msg in context:
-                context_text += f"\n--- {msg.agent_name.upper()} ---\n{msg.content}\n"
+                parts.append(f"\n--- {msg.agent_name.upper()} ---\n{msg.content}\n")
                 if msg.sources:
-                    context_text += "\nSources:\n"
-                    for source in msg.sources:
-                        context_text += f"- {source.title}\n"
-            base_prompt += context_text
+                    parts.append("\nSources:\n")
+                    parts.extend(f"- {source.title}\n" for source in msg.sources)
 
-        return base_prompt
+        return "".join(parts)
@@ -35,6 +35,13 @@ class SystemConfig(BaseModel):
     temperature: float = Field(default_factory=lambda: float(os.getenv("TEMPERATURE", "0.7")))
     max_tokens: int = Field(default_factory=lambda: int(os.getenv("MAX_TOKENS", "4096")))
 
+    # Recently answered questions, reused verbatim when the same question is asked again
+    answer_cache_size: int = Field(default=128, ge=0)
+    answer_cache_ttl_seconds: float = Field(default=600.0, ge=0.0)
+
+    # Questions answered at once by CoordinatorAgent.answer_questions()
+    max_concurrent_questions: int = Field(default=4, gt=0)
+
     # Agent configurations
     coordinator_config: AgentConfig = Field(
         default_factory=lambda: AgentConfig(
@@ -2,12 +2,36 @@
 Coordinator agent that orchestrates collaboration between agents.
 """
 
+import asyncio
+import time
+from collections import OrderedDict
+
 from loguru import logger
 
-from src.agents import FactCheckerAgent, ResearcherAgent, SynthesizerAgent
+from src.agents import BaseAgent, FactCheckerAgent, ResearcherAgent, SynthesizerAgent
+from src.agents.base_agent import create_client
 from src.config import config
 from src.models import AgentMessage, Answer, Question, Source
 
+# Fact-check wording that raises or lowers answer confidence
+_HIGH_CONFIDENCE_KEYWORDS = ("verified", "accurate", "confirmed", "reliable")
+_LOW_CONFIDENCE_KEYWORDS = ("uncertain", "unverified", "questionable", "contradicts")
+
+
+class BatchRequestError(Exception):
+    """Raised when some requests in a message batch did not succeed."""
+
+    def __init__(self, failed: dict[str, str], succeeded: dict[str, AgentMessage]):
+        """
+        Args:
+            failed: Result type ("errored", "canceled" or "expired") by custom ID
+            succeeded: Agent messages of the requests that did succeed, by custom ID
+        """
+        self.failed = failed
+        self.succeeded = succeeded
+        details = ", ".join(f"{custom_id} {result}" for custom_id, result in failed.items())
+        super().__init__(f"{len(failed)} batch request(s) failed: {details}")
+
 
 class CoordinatorAgent:
     """Orchestrates collaboration between multiple agents to answer questions."""
@@ -16,12 +40,19 @@ class CoordinatorAgent:
         """Initialize the coordinator with specialized agents."""
         logger.info("Initializing CoordinatorAgent")
 
-        self.researcher = ResearcherAgent(config.researcher_config)
-        self.fact_checker = FactCheckerAgent(config.fact_checker_config)
-        self.synthesizer = SynthesizerAgent(config.synthesizer_config)
+        # One client (and connection pool) for all agents, owned by this coordinator; its
+        # connections are bound to the event loop they first run on, so it isn't process-wide
+        self.client = create_client()
+
+        self.researcher = ResearcherAgent(config.researcher_config, client=self.client)
+        self.fact_checker = FactCheckerAgent(config.fact_checker_config, client=self.client)
+        self.synthesizer = SynthesizerAgent(config.synthesizer_config, client=self.client)
 
         self.agent_messages: list[AgentMessage] = []
 
+        # question text -> (monotonic time answered, answer), least recently used first
+        self._answer_cache: OrderedDict[str, tuple[float, Answer]] = OrderedDict()
+
     async def answer_question(self, question: Question) -> Answer:
         """
         Coordinate agents to answer a question.
@@ -34,13 +65,19 @@ class CoordinatorAgent:
         """
         logger.info(f"Processing question: {question.question}")
 
-        # Reset agent messages for this question
-        self.agent_messages = []
+        cached = self._cached_answer(question)
+        if cached is not None:
+            logger.info("Question answered from cache")
+            self.agent_messages = list(cached.agent_contributions)
+            return cached
+
+        # Collected locally, since other questions may be answered concurrently
+        messages: list[AgentMessage] = []
 
         # Step 1: Research phase
         logger.info("Step 1: Research phase")
         research_result = await self.researcher.process(question.question)
-        self.agent_messages.append(research_result)
+        messages.append(research_result)
         logger.debug(f"Research complete: {len(research_result.content)} chars")
 
         # Step 2: Fact-checking phase
@@ -48,7 +85,7 @@ class CoordinatorAgent:
         fact_check_result = await self.fact_checker.process(
             question.question, context=[research_result]
         )
-        self.agent_messages.append(fact_check_result)
+        messages.append(fact_check_result)
         logger.debug(f"Fact-checking complete: {len(fact_check_result.content)} chars")
 
         # Step 3: Synthesis phase
@@ -56,40 +93,225 @@ class CoordinatorAgent:
         synthesis_result = await self.synthesizer.process(
             question.question, context=[research_result, fact_check_result]
         )
-        self.agent_messages.append(synthesis_result)
+        messages.append(synthesis_result)
         logger.debug(f"Synthesis complete: {len(synthesis_result.content)} chars")
 
-        # Collect all sources
-        all_sources = self._collect_sources()
-
         # Calculate confidence based on fact-checker feedback
         confidence = self._calculate_confidence(fact_check_result.content)
 
         # Create the final answer
-        answer = Answer(
+        answer = self._build_answer(question, messages, confidence)
+
+        self._cache_answer(question.question, answer)
+
+        logger.info("Question answered successfully")
+        return answer
+
+    async def answer_questions(self, questions: list[Question]) -> list[Answer]:
+        """
+        Answer several questions concurrently.
+
+        Each question runs through answer_question(), with at most
+        config.max_concurrent_questions in flight at once. Afterwards agent_messages
+        holds the contributions for whichever question finished last.
+
+        Args:
+            questions: The questions to answer
+
+        Returns:
+            One Answer per question, in the same order
+        """
+        logger.info(f"Answering {len(questions)} questions concurrently")
+        semaphore = asyncio.Semaphore(config.max_concurrent_questions)
+
+        async def answer(question: Question) -> Answer:
+            async with semaphore:
+                return await self.answer_question(question)
+
+        return list(await asyncio.gather(*(answer(question) for question in questions)))
+
+    async def answer_questions_batch(
+        self, questions: list[Question], poll_interval: float = 60.0, timeout: float = 86400.0
+    ) -> list[Answer]:
+        """
+        Answer many questions through the Message Batches API.
+
+        Runs the same phases as answer_question(), but each phase is submitted for all
+        questions as a single batch. Batches are billed at a discount and may take far
+        longer than direct calls, so this suits background research jobs. Questions with a
+        fresh cached answer, and repeats within the list, are not sent again.
+
+        Args:
+            questions: The questions to answer
+            poll_interval: Seconds to wait between batch status checks
+            timeout: Seconds to wait for each batch before cancelling it; the API itself
+                allows a batch up to 24 hours
+
+        Returns:
+            One Answer per question, in the same order
+
+        Raises:
+            BatchRequestError: If any request in a batch did not succeed
+            TimeoutError: If a batch did not end within the timeout
+        """
+        logger.info(f"Batch-processing {len(questions)} questions")
+        cached = [self._cached_answer(question) for question in questions]
+
+        # question text -> the first question asking it, for each one still to be answered
+        pending: dict[str, Question] = {}
+        for question, answer in zip(questions, cached):
+            if answer is None:
+                pending.setdefault(question.question, question)
+        if not pending:
+            logger.info("All questions answered from cache")
+            return [answer for answer in cached if answer is not None]
+        texts = list(pending)
+
+        # Step 1: Research phase
+        logger.info("Step 1: Research batch")
+        research = await self._run_batch(
+            {f"research-{i}": (self.researcher, text, None) for i, text in enumerate(texts)},
+            poll_interval,
+            timeout,
+        )
+
+        # Step 2: Fact-checking phase
+        logger.info("Step 2: Fact-checking batch")
+        checked = await self._run_batch(
+            {
+                f"fact-check-{i}": (self.fact_checker, text, [research[f"research-{i}"]])
+                for i, text in enumerate(texts)
+            },
+            poll_interval,
+            timeout,
+        )
+
+        # Step 3: Synthesis phase
+        logger.info("Step 3: Synthesis batch")
+        synthesized = await self._run_batch(
+            {
+                f"synthesis-{i}": (
+                    self.synthesizer,
+                    text,
+                    [research[f"research-{i}"], checked[f"fact-check-{i}"]],
+                )
+                for i, text in enumerate(texts)
+            },
+            poll_interval,
+            timeout,
+        )
+
+        fresh: dict[str, Answer] = {}
+        for i, text in enumerate(texts):
+            messages = [
+                research[f"research-{i}"],
+                checked[f"fact-check-{i}"],
+                synthesized[f"synthesis-{i}"],
+            ]
+            confidence = self._calculate_confidence(checked[f"fact-check-{i}"].content)
+            fresh[text] = self._build_answer(pending[text], messages, confidence)
+            self._cache_answer(text, fresh[text])
+
+        answers = []
+        for question, answer in zip(questions, cached):
+            if answer is None:
+                answer = fresh[question.question]
+                if answer.question is not question:
+                    answer = answer.model_copy(deep=True, update={"question": question})
+            answers.append(answer)
+
+        logger.info(f"Batch answered {len(texts)} of {len(questions)} questions")
+        return answers
+
+    async def _run_batch(
+        self,
+        calls: dict[str, tuple[BaseAgent, str, list[AgentMessage] | None]],
+        poll_interval: float,
+        timeout: float,
+    ) -> dict[str, AgentMessage]:
+        """Submit agent calls, keyed by custom ID, as one batch and wait for their messages."""
+        batches = self.client.messages.batches
+
+        batch = await batches.create(
+            requests=[
+                agent.batch_request(custom_id, text, context)
+                for custom_id, (agent, text, context) in calls.items()
+            ]
+        )
+        deadline = time.monotonic() + timeout
+        while batch.processing_status != "ended":
+            if time.monotonic() >= deadline:
+                await batches.cancel(batch.id)
+                raise TimeoutError(f"Batch {batch.id} did not end within {timeout}s; cancelled")
+            await asyncio.sleep(poll_interval)
+            batch = await batches.retrieve(batch.id)
+
+        results = {}
+        failed = {}
+        async for entry in await batches.results(batch.id):
+            if entry.result.type != "succeeded":
+                failed[entry.custom_id] = entry.result.type
+                continue
+            agent = calls[entry.custom_id][0]
+            results[entry.custom_id] = agent.message_from_response(entry.result.message)
+
+        if failed:
+            raise BatchRequestError(failed, results)
+
+        return results
+
+    def _build_answer(
+        self, question: Question, messages: list[AgentMessage], confidence: float
+    ) -> Answer:
+        """Assemble the answer from the research, fact-check and synthesis messages."""
+        self.agent_messages = messages
+
+        return Answer(
             question=question,
-            answer=synthesis_result.content,
-            sources=all_sources,
+            answer=messages[-1].content,
+            sources=self._collect_sources(),
             reasoning=self._build_reasoning(),
             confidence=confidence,
-            agent_contributions=self.agent_messages,
+            agent_contributions=messages,
         )
 
-        logger.info("Question answered successfully")
-        return answer
+    def _cached_answer(self, question: Question) -> Answer | None:
+        """Return a copy of a recent answer to the same question, if one is still fresh."""
+        entry = self._answer_cache.get(question.question)
+        if entry is None:
+            return None
+
+        answered_at, answer = entry
+        if time.monotonic() - answered_at > config.answer_cache_ttl_seconds:
+            del self._answer_cache[question.question]
+            return None
+
+        self._answer_cache.move_to_end(question.question)
+        # Deep, so callers never share the cached sources and contributions lists
+        return answer.model_copy(deep=True, update={"question": question})
+
+    def _cache_answer(self, question_text: str, answer: Answer) -> None:
+        """Remember an answer, evicting the least recently used beyond the cache size."""
+        if config.answer_cache_size == 0:
+            return
+
+        # Copied so later changes to the returned answer don't reach the cache
+        self._answer_cache[question_text] = (time.monotonic(), answer.model_copy(deep=True))
+        self._answer_cache.move_to_end(question_text)
+        while len(self._answer_cache) > config.answer_cache_size:
+            self._answer_cache.popitem(last=False)
 
     def _collect_sources(self) -> list[Source]:
-        """Collect and deduplicate sources from all agents."""
-        sources = []
-        seen_titles = set()
+        """Collect sources from all agents, deduplicated by URL (or by title if there is none)."""
+        # Titles of web sources come from the surrounding text, so the same URL can be cited
+        # under a different title by each agent; the first citation wins
+        unique_sources: dict[str, Source] = {}
 
         for message in self.agent_messages:
             for source in message.sources:
-                if source.title not in seen_titles:
-                    sources.append(source)
-                    seen_titles.add(source.title)
+                unique_sources.setdefault(source.url or source.title, source)
 
-        return sources
+        return list(unique_sources.values())
 
     def _calculate_confidence(self, fact_check_content: str) -> float:
         """
@@ -99,11 +321,8 @@ class CoordinatorAgent:
         content_lower = fact_check_content.lower()
 
         # Simple keyword-based confidence calculation
-        high_confidence_keywords = ["verified", "accurate", "confirmed", "reliable"]
-        low_confidence_keywords = ["uncertain", "unverified", "questionable", "contradicts"]
-
-        high_count = sum(1 for kw in high_confidence_keywords if kw in content_lower)
-        low_count = sum(1 for kw in low_confidence_keywords if kw in content_lower)
+        high_count = sum(1 for kw in _HIGH_CONFIDENCE_KEYWORDS if kw in content_lower)
+        low_count = sum(1 for kw in _LOW_CONFIDENCE_KEYWORDS if kw in content_lower)
 
         # Calculate score (0.5-1.0 range)
         if high_count + low_count == 0:
@@ -3,8 +3,16 @@ Pytest configuration and fixtures.
 """
 
 import os
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
+from anthropic import AsyncAnthropic
+
+from src.config import AgentConfig
+
+# Read before setup_test_env replaces it with a dummy key
+_LIVE_API_KEY = os.getenv("ANTHROPIC_API_KEY") if os.getenv("ANTHROPIC_LIVE") else None
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -20,3 +28,53 @@ def setup_test_env():
     # Cleanup
     for key in ["ANTHROPIC_API_KEY", "DEFAULT_MODEL", "TEMPERATURE", "MAX_TOKENS"]:
         os.environ.pop(key, None)
+
+
+@pytest.fixture(scope="session")
+def agent_config():
+    """Create a test agent configuration."""
+    return AgentConfig(
+        name="test_agent",
+        role="Test role",
+        model="claude-sonnet-4-20250514",
+        temperature=0.7,
+        max_tokens=1000,
+    )
+
+
+@pytest.fixture(scope="session")
+def _anthropic_client_patch():
+    """Patch the Anthropic client once per session with a prebuilt mock."""
+    with patch("src.agents.base_agent.AsyncAnthropic") as mock_client:
+        # Mock the awaitable messages.create method; the response itself is plain data
+        mock_instance = Mock()
+        mock_response = SimpleNamespace(
+            content=[SimpleNamespace(text="Test response from LLM")],
+            usage=SimpleNamespace(
+                input_tokens=20,
+                output_tokens=5,
+                cache_creation_input_tokens=None,
+                cache_read_input_tokens=12,
+            ),
+        )
+        mock_instance.messages.create = AsyncMock(return_value=mock_response)
+        mock_client.return_value = mock_instance
+        yield mock_instance
+
+
+@pytest.fixture
+def mock_anthropic_client(_anthropic_client_patch):
+    """Mock Anthropic client, with its call history cleared for each test."""
+    _anthropic_client_patch.messages.create.reset_mock()
+    return _anthropic_client_patch
+
+
+@pytest.fixture(scope="session")
+async def live_anthropic_client():
+    """A real client for opt-in live tests, shared so its connections stay warm."""
+    if not _LIVE_API_KEY:
+        pytest.skip("set ANTHROPIC_LIVE=1 and ANTHROPIC_API_KEY to run live tests")
+
+    client = AsyncAnthropic(api_key=_LIVE_API_KEY)
+    yield client
+    await client.close()
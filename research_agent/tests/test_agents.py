@@ -2,7 +2,8 @@
 Tests for base agent and specific agents.
 """
 
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
+from unittest.mock import Mock
 
 import pytest
 
@@ -10,41 +11,23 @@ from src.agents.base_agent import BaseAgent
 from src.agents.fact_checker import FactCheckerAgent
 from src.agents.researcher import ResearcherAgent
 from src.agents.synthesizer import SynthesizerAgent
-from src.config import AgentConfig
-from src.models import AgentMessage, SourceType
+from src.models import AgentMessage, Source, SourceType
 
 
 class ConcreteAgent(BaseAgent):
     """Concrete implementation of BaseAgent for testing."""
 
+    SYSTEM_PROMPT = "Test instructions"
+
     def _build_prompt(self, input_text, context=None):
         """Build a simple test prompt."""
         return f"Test prompt: {input_text}"
 
 
-@pytest.fixture
-def agent_config():
-    """Create a test agent configuration."""
-    return AgentConfig(
-        name="test_agent",
-        role="Test role",
-        model="claude-sonnet-4-20250514",
-        temperature=0.7,
-        max_tokens=1000,
-    )
-
-
-@pytest.fixture
-def mock_anthropic_client():
-    """Mock Anthropic client."""
-    with patch("src.agents.base_agent.Anthropic") as mock_client:
-        # Mock the messages.create method
-        mock_instance = Mock()
-        mock_response = Mock()
-        mock_response.content = [Mock(text="Test response from LLM")]
-        mock_instance.messages.create.return_value = mock_response
-        mock_client.return_value = mock_instance
-        yield mock_instance
+@pytest.fixture(scope="module")
+def concrete_agent(agent_config, _anthropic_client_patch):
+    """One ConcreteAgent for the tests that don't depend on a freshly built agent."""
+    return ConcreteAgent(agent_config)
 
 
 class TestBaseAgent:
@@ -52,192 +35,201 @@ class TestBaseAgent:
 
     def test_agent_initialization(self, agent_config, mock_anthropic_client):
         """Test agent initialization."""
-        with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"}):
-            agent = ConcreteAgent(agent_config)
-
-            assert agent.name == "test_agent"
-            assert agent.role == "Test role"
-            assert agent.config == agent_config
-
-    def test_agent_requires_api_key(self, agent_config):
-        """Test that agent raises error without API key."""
-        with patch.dict("os.environ", {}, clear=True):
-            with pytest.raises(ValueError, match="ANTHROPIC_API_KEY not found"):
-                ConcreteAgent(agent_config)
-
-    @pytest.mark.asyncio
-    async def test_process(self, agent_config, mock_anthropic_client):
-        """Test processing input."""
-        with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"}):
-            agent = ConcreteAgent(agent_config)
-
-            result = await agent.process("Test input")
-
-            assert isinstance(result, AgentMessage)
-            assert result.agent_name == "test_agent"
-            assert len(result.content) > 0
-
-    @pytest.mark.asyncio
-    async def test_get_llm_response(self, agent_config, mock_anthropic_client):
-        """Test getting LLM response."""
-        with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"}):
-            agent = ConcreteAgent(agent_config)
-
-            response, sources = await agent._get_llm_response("Test prompt")
-
-            assert response == "Test response from LLM"
-            assert isinstance(sources, list)
-            mock_anthropic_client.messages.create.assert_called_once()
-
-    def test_extract_sources(self, agent_config, mock_anthropic_client):
-        """Test source extraction from text."""
-        with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"}):
-            agent = ConcreteAgent(agent_config)
-
-            sources = agent._extract_sources("Some text with sources")
-
-            assert isinstance(sources, list)
-
-    def test_extract_sources_with_source_tag(self, agent_config, mock_anthropic_client):
-        """Test extracting sources with [Source: ...] format."""
-        with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"}):
-            agent = ConcreteAgent(agent_config)
-
-            text = "According to research [Source: Climate Report 2025] and [Source: https://example.com/article]"
-            sources = agent._extract_sources(text)
-
-            assert len(sources) == 2
-            assert sources[0].title == "Climate Report 2025"
-            assert sources[0].source_type == SourceType.DERIVED
-            assert sources[1].url == "https://example.com/article"
-            assert sources[1].source_type == SourceType.WEB
-
-    def test_extract_sources_with_urls(self, agent_config, mock_anthropic_client):
-        """Test extracting sources from URLs in text."""
-        with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"}):
-            agent = ConcreteAgent(agent_config)
-
-            text = "Research shows https://www.nature.com/articles/123 and data from https://arxiv.org/paper/456"
-            sources = agent._extract_sources(text)
-
-            assert len(sources) >= 2
-            assert any("nature.com" in s.url for s in sources if s.url)
-            assert any("arxiv.org" in s.url for s in sources if s.url)
+        agent = ConcreteAgent(agent_config)
 
-    def test_extract_sources_with_citations(self, agent_config, mock_anthropic_client):
-        """Test extracting academic citations."""
-        with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"}):
-            agent = ConcreteAgent(agent_config)
+        assert agent.name == "test_agent"
+        assert agent.role == "Test role"
+        assert agent.config == agent_config
 
-            text = "According to research (Smith, 2024) and studies (Johnson et al., 2023)"
-            sources = agent._extract_sources(text)
+    def test_agent_creates_client(self, agent_config, mock_anthropic_client):
+        """Test that an agent without an injected client creates its own."""
+        agent = ConcreteAgent(agent_config)
 
-            assert len(sources) >= 2
-            assert any("Smith, 2024" in s.title for s in sources)
-            assert any("Johnson et al., 2023" in s.title for s in sources)
-            assert all(s.source_type == SourceType.RESEARCH for s in sources)
-
-    def test_extract_sources_mixed_formats(self, agent_config, mock_anthropic_client):
-        """Test extracting sources from mixed formats."""
-        with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"}):
-            agent = ConcreteAgent(agent_config)
-
-            text = """Based on [Source: WHO Guidelines] and research (Brown, 2025).
-            More info at https://www.cdc.gov/report.html"""
-            sources = agent._extract_sources(text)
-
-            assert len(sources) >= 3
-            source_types = [s.source_type for s in sources]
-            assert SourceType.DERIVED in source_types or SourceType.WEB in source_types
-            assert SourceType.RESEARCH in source_types
-
-
-class TestResearcherAgent:
-    """Tests for ResearcherAgent."""
-
-    def test_build_prompt_without_context(self, agent_config, mock_anthropic_client):
-        """Test building research prompt without context."""
-        with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"}):
-            agent = ResearcherAgent(agent_config)
-
-            prompt = agent._build_prompt("What is AI?")
-
-            assert "research agent" in prompt.lower()
-            assert "What is AI?" in prompt
-            assert "comprehensive" in prompt.lower()
-
-    def test_build_prompt_with_context(self, agent_config, mock_anthropic_client):
-        """Test building research prompt with context."""
-        with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"}):
-            agent = ResearcherAgent(agent_config)
-
-            context = [AgentMessage(agent_name="other", content="Previous context")]
-            prompt = agent._build_prompt("What is AI?", context)
-
-            assert "What is AI?" in prompt
-            assert "Previous context" in prompt
-
-
-class TestFactCheckerAgent:
-    """Tests for FactCheckerAgent."""
-
-    def test_build_prompt_without_context(self, agent_config, mock_anthropic_client):
-        """Test building fact-check prompt without context."""
-        with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"}):
-            agent = FactCheckerAgent(agent_config)
-
-            prompt = agent._build_prompt("AI is intelligent")
-
-            assert "fact-checker" in prompt.lower()
-            assert "AI is intelligent" in prompt
-            assert "verify" in prompt.lower()
-
-    def test_build_prompt_with_context(self, agent_config, mock_anthropic_client):
-        """Test building fact-check prompt with context."""
-        with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"}):
-            from src.models import Source, SourceType
-
-            agent = FactCheckerAgent(agent_config)
-
-            context = [
-                AgentMessage(
-                    agent_name="researcher",
-                    content="Research findings",
-                    sources=[Source(title="Test Source", source_type=SourceType.WEB)],
-                )
-            ]
-            prompt = agent._build_prompt("Claim to verify", context)
-
-            assert "Research findings" in prompt
-            assert "Test Source" in prompt
+        assert agent.client is mock_anthropic_client
 
+    def test_agent_requires_api_key(self, agent_config, monkeypatch):
+        """Test that agent raises error without API key."""
+        monkeypatch.delenv("ANTHROPIC_API_KEY")
 
-class TestSynthesizerAgent:
-    """Tests for SynthesizerAgent."""
+        with pytest.raises(ValueError, match="ANTHROPIC_API_KEY not found"):
+            ConcreteAgent(agent_config)
 
-    def test_build_prompt_without_context(self, agent_config, mock_anthropic_client):
-        """Test building synthesis prompt without context."""
-        with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"}):
-            agent = SynthesizerAgent(agent_config)
+    def test_agent_uses_injected_client(self, agent_config, monkeypatch):
+        """Test that an injected client is used as-is, without needing an API key."""
+        monkeypatch.delenv("ANTHROPIC_API_KEY")
+        client = Mock()
 
-            prompt = agent._build_prompt("What is AI?")
+        agent = ConcreteAgent(agent_config, client=client)
 
-            assert "synthesizer" in prompt.lower()
-            assert "What is AI?" in prompt
-            assert "coherent" in prompt.lower()
+        assert agent.client is client
 
-    def test_build_prompt_with_context(self, agent_config, mock_anthropic_client):
-        """Test building synthesis prompt with context."""
-        with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"}):
-            agent = SynthesizerAgent(agent_config)
+    async def test_process(self, concrete_agent, mock_anthropic_client):
+        """Test processing input."""
+        result = await concrete_agent.process("Test input")
 
-            context = [
-                AgentMessage(agent_name="researcher", content="Research data"),
-                AgentMessage(agent_name="fact_checker", content="Verified facts"),
-            ]
-            prompt = agent._build_prompt("What is AI?", context)
+        assert isinstance(result, AgentMessage)
+        assert result.agent_name == "test_agent"
+        assert len(result.content) > 0
+        assert result.metadata["cache_read_input_tokens"] == 12
+        assert result.metadata["cache_creation_input_tokens"] == 0
 
-            assert "Research data" in prompt
-            assert "Verified facts" in prompt
-            assert "RESEARCHER" in prompt
-            assert "FACT_CHECKER" in prompt
+    async def test_get_llm_response(self, concrete_agent, mock_anthropic_client):
+        """Test getting LLM response."""
+        response, sources, usage = await concrete_agent._get_llm_response("Test prompt")
+
+        assert response == "Test response from LLM"
+        assert isinstance(sources, list)
+        assert usage["input_tokens"] == 20
+        mock_anthropic_client.messages.create.assert_awaited_once()
+
+        kwargs = mock_anthropic_client.messages.create.await_args.kwargs
+        assert kwargs["system"] == [
+            {
+                "type": "text",
+                "text": "Test instructions",
+                "cache_control": {"type": "ephemeral"},
+            }
+        ]
+        assert kwargs["messages"] == [{"role": "user", "content": "Test prompt"}]
+
+    def test_batch_request(self, concrete_agent):
+        """Test that batch requests carry the same parameters as direct calls."""
+        request = concrete_agent.batch_request("research-0", "Test input")
+
+        assert request["custom_id"] == "research-0"
+        assert request["params"]["model"] == concrete_agent.config.model
+        assert request["params"]["system"][0]["text"] == "Test instructions"
+        assert request["params"]["messages"] == [
+            {"role": "user", "content": "Test prompt: Test input"}
+        ]
+
+    def test_message_from_response(self, concrete_agent):
+        """Test turning a batch result message into an agent message."""
+        response = SimpleNamespace(
+            content=[SimpleNamespace(text="See (Smith, 2024)")],
+            usage=SimpleNamespace(
+                input_tokens=1,
+                output_tokens=1,
+                cache_creation_input_tokens=0,
+                cache_read_input_tokens=0,
+            ),
+        )
+
+        message = concrete_agent.message_from_response(response)
+
+        assert message.agent_name == "test_agent"
+        assert message.content == "See (Smith, 2024)"
+        assert [s.title for s in message.sources] == ["Smith, 2024"]
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            pytest.param("Some text with sources", [], id="no-sources"),
+            pytest.param(
+                "According to research [Source: Climate Report 2025] and [Source: https://example.com/article]",
+                [
+                    (SourceType.DERIVED, "Climate Report 2025"),
+                    (SourceType.WEB, "https://example.com/article"),
+                ],
+                id="source-tag",
+            ),
+            pytest.param(
+                "Research shows https://www.nature.com/articles/123 and data from https://arxiv.org/paper/456",
+                [
+                    (SourceType.WEB, "https://www.nature.com/articles/123"),
+                    (SourceType.WEB, "https://arxiv.org/paper/456"),
+                ],
+                id="urls",
+            ),
+            pytest.param(
+                "According to research (Smith, 2024) and studies (Johnson et al., 2023)",
+                [
+                    (SourceType.RESEARCH, "Smith, 2024"),
+                    (SourceType.RESEARCH, "Johnson et al., 2023"),
+                ],
+                id="citations",
+            ),
+            pytest.param(
+                """Based on [Source: WHO Guidelines] and research (Brown, 2025).
+        More info at https://www.cdc.gov/report.html""",
+                [
+                    (SourceType.DERIVED, "WHO Guidelines"),
+                    (SourceType.WEB, "https://www.cdc.gov/report.html"),
+                    (SourceType.RESEARCH, "Brown, 2025"),
+                ],
+                id="mixed-formats",
+            ),
+        ],
+    )
+    def test_extract_sources(self, concrete_agent, text, expected):
+        """Test source extraction; web sources are identified by URL, others by title."""
+        sources = concrete_agent._extract_sources(text)
+
+        assert [(s.source_type, s.url or s.title) for s in sources] == expected
+
+
+# Per agent class: words its role instructions must contain, and how it lays out the
+# context from other agents (see _PROMPT_CONTEXT)
+_SYSTEM_PROMPT_WORDS = {
+    ResearcherAgent: ["research agent", "comprehensive"],
+    FactCheckerAgent: ["fact-checker", "verify"],
+    SynthesizerAgent: ["synthesizer", "coherent"],
+}
+_CONTEXT_FRAGMENTS = {
+    ResearcherAgent: ["researcher: Research findings", "fact_checker: Verified facts"],
+    FactCheckerAgent: ["researcher:\nResearch findings", "Sources:\n- Test Source"],
+    SynthesizerAgent: ["--- RESEARCHER ---", "--- FACT_CHECKER ---", "Sources:\n- Test Source"],
+}
+_PROMPT_CONTEXT = [
+    AgentMessage(
+        agent_name="researcher",
+        content="Research findings",
+        sources=[Source(title="Test Source", source_type=SourceType.WEB)],
+    ),
+    AgentMessage(agent_name="fact_checker", content="Verified facts"),
+]
+
+
+@pytest.fixture(
+    scope="module",
+    params=[ResearcherAgent, FactCheckerAgent, SynthesizerAgent],
+    ids=["researcher", "fact_checker", "synthesizer"],
+)
+def agent(request, agent_config, _anthropic_client_patch):
+    """Each specialized agent in turn, built once per module."""
+    return request.param(agent_config)
+
+
+class TestAgentPrompts:
+    """Tests for the specialized agents' prompts."""
+
+    def test_build_prompt_without_context(self, agent):
+        """Test building a prompt without context."""
+        prompt = agent._build_prompt("What is AI?")
+
+        for word in _SYSTEM_PROMPT_WORDS[type(agent)]:
+            assert word in agent.SYSTEM_PROMPT.lower()
+        assert "What is AI?" in prompt
+        # The role instructions go in the cached system prompt, not the user turn
+        assert agent.SYSTEM_PROMPT not in prompt
+
+    def test_build_prompt_with_context(self, agent):
+        """Test building a prompt with context from other agents."""
+        prompt = agent._build_prompt("What is AI?", _PROMPT_CONTEXT)
+
+        assert "What is AI?" in prompt
+        for fragment in _CONTEXT_FRAGMENTS[type(agent)]:
+            assert fragment in prompt
+
+
+class TestLiveAgent:
+    """Round trips against the real API, run only when ANTHROPIC_LIVE is set."""
+
+    async def test_live_process(self, agent_config, live_anthropic_client):
+        """Test that successive calls over the pooled client both get answers."""
+        agent = ConcreteAgent(agent_config, client=live_anthropic_client)
+
+        for _ in range(2):
+            result = await agent.process("Reply with the word ok")
+            assert result.content
+            assert result.metadata["output_tokens"] > 0
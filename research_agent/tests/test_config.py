@@ -2,71 +2,72 @@
 Tests for configuration.
 """
 
+import pytest
+
 from src.config import AgentConfig, SystemConfig
 
 
+@pytest.fixture(scope="module")
+def system_config():
+    """A default SystemConfig, shared by the tests that only read it."""
+    return SystemConfig()
+
+
 class TestAgentConfig:
     """Tests for AgentConfig."""
 
-    def test_agent_config_creation(self):
-        """Test creating agent config."""
-        config = AgentConfig(name="test_agent", role="Testing agent")
+    @pytest.mark.parametrize(
+        ("overrides", "expected"),
+        [
+            (
+                {},
+                {"model": "claude-sonnet-4-20250514", "temperature": 0.7, "max_tokens": 4096},
+            ),
+            (
+                {"model": "custom-model", "temperature": 0.5, "max_tokens": 2000},
+                {"model": "custom-model", "temperature": 0.5, "max_tokens": 2000},
+            ),
+        ],
+        ids=["defaults", "custom-values"],
+    )
+    def test_agent_config_values(self, overrides, expected):
+        """Test agent config defaults and custom values."""
+        config = AgentConfig(name="test_agent", role="Testing agent", **overrides)
         assert config.name == "test_agent"
         assert config.role == "Testing agent"
-        assert config.model == "claude-sonnet-4-20250514"
-        assert config.temperature == 0.7
-        assert config.max_tokens == 4096
+        for field, value in expected.items():
+            assert getattr(config, field) == value
 
-    def test_agent_config_custom_values(self):
-        """Test agent config with custom values."""
-        config = AgentConfig(
-            name="test_agent",
-            role="Testing",
-            model="custom-model",
-            temperature=0.5,
-            max_tokens=2000,
-        )
-        assert config.model == "custom-model"
-        assert config.temperature == 0.5
-        assert config.max_tokens == 2000
-
-    def test_temperature_bounds(self):
-        """Test temperature validation."""
-        # Valid temperatures
-        config = AgentConfig(name="test", role="test", temperature=0.0)
-        assert config.temperature == 0.0
-
-        config = AgentConfig(name="test", role="test", temperature=2.0)
-        assert config.temperature == 2.0
+    @pytest.mark.parametrize("temperature", [0.0, 2.0])
+    def test_temperature_bounds(self, temperature):
+        """Test temperature validation accepts the bounds."""
+        config = AgentConfig(name="test", role="test", temperature=temperature)
+        assert config.temperature == temperature
 
 
 class TestSystemConfig:
     """Tests for SystemConfig."""
 
-    def test_system_config_creation(self):
+    def test_system_config_creation(self, system_config):
         """Test creating system config."""
-        config = SystemConfig()
-        assert config.default_model == "claude-sonnet-4-20250514"
-        assert config.temperature == 0.7
-        assert config.max_tokens == 4096
+        assert system_config.default_model == "claude-sonnet-4-20250514"
+        assert system_config.temperature == 0.7
+        assert system_config.max_tokens == 4096
 
-    def test_agent_configs_exist(self):
+    def test_agent_configs_exist(self, system_config):
         """Test that all agent configs are created."""
-        config = SystemConfig()
-        assert config.coordinator_config is not None
-        assert config.researcher_config is not None
-        assert config.fact_checker_config is not None
-        assert config.synthesizer_config is not None
+        assert system_config.coordinator_config is not None
+        assert system_config.researcher_config is not None
+        assert system_config.fact_checker_config is not None
+        assert system_config.synthesizer_config is not None
 
-    def test_agent_config_properties(self):
+    def test_agent_config_properties(self, system_config):
         """Test agent config properties."""
-        config = SystemConfig()
-
-        assert config.researcher_config.name == "researcher"
-        assert "research" in config.researcher_config.role.lower()
+        assert system_config.researcher_config.name == "researcher"
+        assert "research" in system_config.researcher_config.role.lower()
 
-        assert config.fact_checker_config.name == "fact_checker"
-        assert "fact" in config.fact_checker_config.role.lower()
+        assert system_config.fact_checker_config.name == "fact_checker"
+        assert "fact" in system_config.fact_checker_config.role.lower()
 
-        assert config.synthesizer_config.name == "synthesizer"
-        assert "synthe" in config.synthesizer_config.role.lower()
+        assert system_config.synthesizer_config.name == "synthesizer"
+        assert "synthe" in system_config.synthesizer_config.role.lower()
@@ -2,69 +2,167 @@
 Tests for coordinator agent.
 """
 
+import asyncio
+import time
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
-from src.coordinator import CoordinatorAgent
+import src.coordinator as coordinator_module
+from src.agents import FactCheckerAgent, ResearcherAgent, SynthesizerAgent
+from src.config import config
+from src.coordinator import BatchRequestError, CoordinatorAgent
 from src.models import AgentMessage, Answer, Question, Source, SourceType
 
-
-@pytest.fixture
-def mock_agents():
-    """Create mock agents."""
+# Canned agent replies, built once for the module
+_RESEARCH_MESSAGE = AgentMessage(
+    agent_name="researcher",
+    content="Research findings about renewable energy",
+    sources=[Source(title="Research Source", source_type=SourceType.RESEARCH)],
+)
+_FACT_CHECK_MESSAGE = AgentMessage(
+    agent_name="fact_checker", content="Facts are verified and accurate", sources=[]
+)
+_SYNTHESIS_MESSAGE = AgentMessage(
+    agent_name="synthesizer",
+    content="Synthesized answer about renewable energy benefits",
+    sources=[],
+)
+
+# Agent messages whose sources overlap, by title and by URL
+_TITLED_SOURCE_MESSAGES = [
+    AgentMessage(
+        agent_name="agent1",
+        content="Test",
+        sources=[
+            Source(title="Source 1", source_type=SourceType.WEB),
+            Source(title="Source 2", source_type=SourceType.RESEARCH),
+        ],
+    ),
+    AgentMessage(
+        agent_name="agent2",
+        content="Test",
+        sources=[
+            Source(title="Source 1", source_type=SourceType.WEB),  # Duplicate
+            Source(title="Source 3", source_type=SourceType.INTERNAL),
+        ],
+    ),
+]
+_URL_SOURCE_MESSAGES = [
+    AgentMessage(
+        agent_name="researcher",
+        content="Test",
+        sources=[
+            Source(title="Solar report", url="https://example.com/a", source_type=SourceType.WEB),
+            Source(title="Other page", url="https://example.com/b", source_type=SourceType.WEB),
+        ],
+    ),
+    AgentMessage(
+        agent_name="synthesizer",
+        content="Test",
+        sources=[
+            Source(title="Per the report", url="https://example.com/a", source_type=SourceType.WEB),
+        ],
+    ),
+]
+
+
+@pytest.fixture(scope="module")
+def _agent_mocks():
+    """Patch the agent classes once per module with spec'd mock agents."""
+    agents = {
+        "researcher": Mock(spec=ResearcherAgent),
+        "fact_checker": Mock(spec=FactCheckerAgent),
+        "synthesizer": Mock(spec=SynthesizerAgent),
+    }
     with (
-        patch("src.coordinator.ResearcherAgent") as researcher,
-        patch("src.coordinator.FactCheckerAgent") as fact_checker,
-        patch("src.coordinator.SynthesizerAgent") as synthesizer,
+        patch("src.coordinator.create_client", return_value=AsyncMock()),
+        patch("src.coordinator.ResearcherAgent", return_value=agents["researcher"]),
+        patch("src.coordinator.FactCheckerAgent", return_value=agents["fact_checker"]),
+        patch("src.coordinator.SynthesizerAgent", return_value=agents["synthesizer"]),
     ):
+        yield agents
 
-        # Setup mock researcher
-        researcher_instance = Mock()
-        researcher_instance.process = AsyncMock(
-            return_value=AgentMessage(
-                agent_name="researcher",
-                content="Research findings about renewable energy",
-                sources=[Source(title="Research Source", source_type=SourceType.RESEARCH)],
-            )
-        )
-        researcher.return_value = researcher_instance
 
-        # Setup mock fact checker
-        fact_checker_instance = Mock()
-        fact_checker_instance.process = AsyncMock(
-            return_value=AgentMessage(
-                agent_name="fact_checker", content="Facts are verified and accurate", sources=[]
-            )
-        )
-        fact_checker.return_value = fact_checker_instance
-
-        # Setup mock synthesizer
-        synthesizer_instance = Mock()
-        synthesizer_instance.process = AsyncMock(
-            return_value=AgentMessage(
-                agent_name="synthesizer",
-                content="Synthesized answer about renewable energy benefits",
-                sources=[],
-            )
-        )
-        synthesizer.return_value = synthesizer_instance
+@pytest.fixture
+def mock_agents(_agent_mocks):
+    """Mock agents, reset to their canned replies for each test."""
+    replies = {
+        "researcher": _RESEARCH_MESSAGE,
+        "fact_checker": _FACT_CHECK_MESSAGE,
+        "synthesizer": _SYNTHESIS_MESSAGE,
+    }
+    for name, agent in _agent_mocks.items():
+        agent.reset_mock(return_value=True, side_effect=True)
+        agent.process.return_value = replies[name]
+
+    return _agent_mocks
+
+
+@pytest.fixture(scope="module")
+def _coordinator(_agent_mocks):
+    return CoordinatorAgent()
+
+
+@pytest.fixture
+def coordinator(_coordinator, mock_agents):
+    """The module's coordinator, with its per-question state cleared for each test."""
+    _coordinator.agent_messages = []
+    _coordinator._answer_cache.clear()
+    _coordinator.client.reset_mock(return_value=True, side_effect=True)
+    return _coordinator
+
+
+@pytest.fixture
+def batch_api(coordinator, mock_agents):
+    """
+    Fake the Message Batches API on the coordinator's client.
+
+    Every batch ends immediately and echoes each request's custom ID in its message, with
+    "fact-check-1" casting doubt on its research. Returns the custom IDs of each batch
+    submitted, in order.
+    """
+    submitted: list[list[str]] = []
+
+    def batch_request(custom_id, input_text, context=None):
+        return {"custom_id": custom_id, "context": context}
+
+    for agent in mock_agents.values():
+        agent.batch_request.side_effect = batch_request
+        agent.message_from_response.side_effect = lambda message: message
 
-        yield {
-            "researcher": researcher_instance,
-            "fact_checker": fact_checker_instance,
-            "synthesizer": synthesizer_instance,
-        }
+    async def create(requests):
+        submitted.append([request["custom_id"] for request in requests])
+        return Mock(id=len(submitted) - 1, processing_status="in_progress")
+
+    async def results(batch_id):
+        async def entries():
+            for custom_id in submitted[batch_id]:
+                content = "uncertain" if custom_id == "fact-check-1" else f"verified {custom_id}"
+                message = AgentMessage(agent_name=custom_id, content=content)
+                yield Mock(custom_id=custom_id, result=Mock(type="succeeded", message=message))
+
+        return entries()
+
+    batches = coordinator.client.messages.batches
+    batches.create.side_effect = create
+    batches.retrieve.side_effect = lambda batch_id: Mock(id=batch_id, processing_status="ended")
+    batches.results.side_effect = results
+
+    return submitted
 
 
 class TestCoordinatorAgent:
     """Tests for CoordinatorAgent."""
 
-    @pytest.mark.asyncio
-    async def test_answer_question(self, mock_agents):
-        """Test answering a question."""
-        coordinator = CoordinatorAgent()
+    def test_agents_share_coordinator_client(self, coordinator):
+        """Test that every agent is built with the coordinator's own client."""
+        for agent_class in (ResearcherAgent, FactCheckerAgent, SynthesizerAgent):
+            patched = getattr(coordinator_module, agent_class.__name__)
+            assert patched.call_args.kwargs["client"] is coordinator.client
 
+    async def test_answer_question(self, coordinator):
+        """Test answering a question."""
         question = Question(
             question="What are the benefits of renewable energy?", context="Focus on solar and wind"
         )
@@ -77,11 +175,8 @@ class TestCoordinatorAgent:
         assert 0 <= answer.confidence <= 1.0
         assert len(answer.agent_contributions) == 3
 
-    @pytest.mark.asyncio
-    async def test_agents_called_in_order(self, mock_agents):
+    async def test_agents_called_in_order(self, coordinator, mock_agents):
         """Test that agents are called in the correct order."""
-        coordinator = CoordinatorAgent()
-
         question = Question(question="Test question")
         await coordinator.answer_question(question)
 
@@ -94,30 +189,151 @@ class TestCoordinatorAgent:
         # Verify synthesizer was called last
         assert mock_agents["synthesizer"].process.called
 
-    def test_collect_sources(self, mock_agents):
-        """Test source collection and deduplication."""
-        coordinator = CoordinatorAgent()
+    async def test_synthesis_follows_fact_check(self, coordinator, mock_agents):
+        """Test that the synthesizer runs once, with the research and the fact-check."""
+        await coordinator.answer_question(Question(question="Test question"))
+
+        mock_agents["synthesizer"].process.assert_awaited_once()
+        context = mock_agents["synthesizer"].process.await_args.kwargs["context"]
+        assert [msg.agent_name for msg in context] == ["researcher", "fact_checker"]
+
+    async def test_repeated_question_answered_from_cache(self, coordinator, mock_agents):
+        """Test that asking the same question again skips the agents."""
+        first = await coordinator.answer_question(Question(question="Test question"))
+        repeat_question = Question(question="Test question")
+        second = await coordinator.answer_question(repeat_question)
+
+        mock_agents["researcher"].process.assert_awaited_once()
+        assert second.answer == first.answer
+        assert second.question is repeat_question
+
+        await coordinator.answer_question(Question(question="Another question"))
+        assert mock_agents["researcher"].process.await_count == 2
+
+    async def test_expired_cached_answer_is_recomputed(self, coordinator, mock_agents):
+        """Test that cached answers older than the TTL are not reused."""
+        answer = await coordinator.answer_question(Question(question="Test question"))
+        # Backdate the cached entry past the TTL
+        coordinator._answer_cache["Test question"] = (time.monotonic() - 10_000, answer)
+        await coordinator.answer_question(Question(question="Test question"))
+
+        assert mock_agents["researcher"].process.await_count == 2
+
+    async def test_cached_answers_are_independent_copies(self, coordinator):
+        """Test that changing a returned answer doesn't change later cache hits."""
+        first = await coordinator.answer_question(Question(question="Test question"))
+        first.sources.clear()
+        second = await coordinator.answer_question(Question(question="Test question"))
+        third = await coordinator.answer_question(Question(question="Test question"))
+
+        assert len(second.sources) == 1
+        assert second.sources is not third.sources
+        assert second.agent_contributions is not third.agent_contributions
+
+    async def test_answer_questions(self, coordinator, mock_agents):
+        """Test answering questions concurrently, up to the configured limit."""
+        in_flight = 0
+        peak = 0
+
+        async def research(input_text, context=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return AgentMessage(agent_name="researcher", content=f"Research on {input_text}")
+
+        mock_agents["researcher"].process.side_effect = research
+        questions = [Question(question=f"Question {i}") for i in range(6)]
+
+        answers = await coordinator.answer_questions(questions)
+
+        assert [answer.question for answer in answers] == questions
+        for question, answer in zip(questions, answers):
+            assert answer.agent_contributions[0].content == f"Research on {question.question}"
+        assert mock_agents["researcher"].process.await_count == 6
+        assert mock_agents["fact_checker"].process.await_count == 6
+        assert peak == config.max_concurrent_questions
+
+    async def test_answer_questions_batch(self, coordinator, batch_api):
+        """Test answering questions with one message batch per phase."""
+        questions = [Question(question="First question"), Question(question="Second question")]
+
+        answers = await coordinator.answer_questions_batch(questions, poll_interval=0)
+
+        assert batch_api == [
+            ["research-0", "research-1"],
+            ["fact-check-0", "fact-check-1"],
+            ["synthesis-0", "synthesis-1"],
+        ]
+        assert [answer.question for answer in answers] == questions
+        assert answers[0].answer == "verified synthesis-0"
+        assert answers[1].answer == "verified synthesis-1"
+        assert answers[0].confidence > answers[1].confidence
+        assert [msg.agent_name for msg in answers[1].agent_contributions] == [
+            "research-1",
+            "fact-check-1",
+            "synthesis-1",
+        ]
 
-        # Add some mock messages with sources
-        coordinator.agent_messages = [
-            AgentMessage(
-                agent_name="agent1",
-                content="Test",
-                sources=[
-                    Source(title="Source 1", source_type=SourceType.WEB),
-                    Source(title="Source 2", source_type=SourceType.RESEARCH),
-                ],
-            ),
-            AgentMessage(
-                agent_name="agent2",
-                content="Test",
-                sources=[
-                    Source(title="Source 1", source_type=SourceType.WEB),  # Duplicate
-                    Source(title="Source 3", source_type=SourceType.INTERNAL),
-                ],
-            ),
+    async def test_answer_questions_batch_skips_cached_and_repeated(self, coordinator, batch_api):
+        """Test that batches only carry questions that aren't cached or already included."""
+        await coordinator.answer_question(Question(question="Cached question"))
+        questions = [
+            Question(question="Cached question"),
+            Question(question="New question"),
+            Question(question="New question"),
         ]
 
+        answers = await coordinator.answer_questions_batch(questions, poll_interval=0)
+
+        assert batch_api[0] == ["research-0"]
+        assert [answer.question for answer in answers] == questions
+        assert answers[0].answer == "Synthesized answer about renewable energy benefits"
+        assert answers[1].answer == answers[2].answer == "verified synthesis-0"
+        assert answers[1].sources is not answers[2].sources
+
+        await coordinator.answer_questions_batch(questions, poll_interval=0)
+        assert len(batch_api) == 3
+
+    async def test_answer_questions_batch_cancels_on_timeout(self, coordinator, batch_api):
+        """Test that a batch still running at the timeout is cancelled."""
+        batches = coordinator.client.messages.batches
+        batches.retrieve.side_effect = lambda batch_id: Mock(
+            id=batch_id, processing_status="in_progress"
+        )
+
+        with pytest.raises(TimeoutError):
+            await coordinator.answer_questions_batch(
+                [Question(question="Test question")], poll_interval=0, timeout=0
+            )
+
+        batches.cancel.assert_awaited_once_with(0)
+
+    async def test_answer_questions_batch_reports_failed_requests(self, coordinator, batch_api):
+        """Test that failed batch requests are raised with their custom IDs."""
+
+        async def results(batch_id):
+            async def entries():
+                message = AgentMessage(agent_name="researcher", content="Research")
+                yield Mock(custom_id="research-0", result=Mock(type="succeeded", message=message))
+                yield Mock(custom_id="research-1", result=Mock(type="errored"))
+
+            return entries()
+
+        coordinator.client.messages.batches.results.side_effect = results
+        questions = [Question(question="First question"), Question(question="Second question")]
+
+        with pytest.raises(BatchRequestError) as excinfo:
+            await coordinator.answer_questions_batch(questions, poll_interval=0)
+
+        assert excinfo.value.failed == {"research-1": "errored"}
+        assert list(excinfo.value.succeeded) == ["research-0"]
+
+    def test_collect_sources(self, coordinator):
+        """Test source collection and deduplication."""
+        coordinator.agent_messages = list(_TITLED_SOURCE_MESSAGES)
+
         sources = coordinator._collect_sources()
 
         # Should have 3 unique sources
@@ -127,10 +343,17 @@ class TestCoordinatorAgent:
         assert "Source 2" in titles
         assert "Source 3" in titles
 
-    def test_calculate_confidence_high(self, mock_agents):
-        """Test confidence calculation with positive indicators."""
-        coordinator = CoordinatorAgent()
+    def test_collect_sources_dedupes_by_url(self, coordinator):
+        """Test that one URL cited under different titles is collected once."""
+        coordinator.agent_messages = list(_URL_SOURCE_MESSAGES)
 
+        sources = coordinator._collect_sources()
+
+        assert [s.url for s in sources] == ["https://example.com/a", "https://example.com/b"]
+        assert sources[0].title == "Solar report"
+
+    def test_calculate_confidence_high(self, coordinator):
+        """Test confidence calculation with positive indicators."""
         fact_check_content = (
             "The information is verified and accurate. All sources are reliable and confirmed."
         )
@@ -138,10 +361,8 @@ class TestCoordinatorAgent:
 
         assert confidence > 0.7
 
-    def test_calculate_confidence_low(self, mock_agents):
+    def test_calculate_confidence_low(self, coordinator):
         """Test confidence calculation with negative indicators."""
-        coordinator = CoordinatorAgent()
-
         fact_check_content = (
             "The information is uncertain and unverified. Sources are questionable."
         )
@@ -149,19 +370,15 @@ class TestCoordinatorAgent:
 
         assert confidence < 0.7
 
-    def test_calculate_confidence_default(self, mock_agents):
+    def test_calculate_confidence_default(self, coordinator):
         """Test default confidence when no keywords found."""
-        coordinator = CoordinatorAgent()
-
         fact_check_content = "Some neutral content without specific keywords."
         confidence = coordinator._calculate_confidence(fact_check_content)
 
         assert confidence == 0.7
 
-    def test_build_reasoning(self, mock_agents):
+    def test_build_reasoning(self, coordinator):
         """Test reasoning building from agent messages."""
-        coordinator = CoordinatorAgent()
-
         coordinator.agent_messages = [
             AgentMessage(agent_name="researcher", content="A" * 300),
             AgentMessage(agent_name="fact_checker", content="B" * 300),
@@ -4,59 +4,86 @@ Tests for data models.
 
 from datetime import datetime
 
+import pytest
+
 from src.models import AgentMessage, Answer, Question, Source, SourceType
 
 
+@pytest.fixture(scope="module")
+def question():
+    """A plain question, shared by the answer tests that only read it."""
+    return Question(question="What is AI?")
+
+
+# (title, source type) of the sources attached to answers
+_SOURCE_SPECS = (("Source 1", SourceType.RESEARCH), ("Source 2", SourceType.WEB))
+
+
+@pytest.fixture(scope="module")
+def sources():
+    """Sources built from _SOURCE_SPECS; answers hold them without mutating them."""
+    return [Source(title=title, source_type=source_type) for title, source_type in _SOURCE_SPECS]
+
+
 class TestQuestion:
     """Tests for Question model."""
 
-    def test_question_creation(self):
+    @pytest.mark.parametrize(
+        ("kwargs", "expected"),
+        [
+            ({}, {"question": "What is AI?", "context": None}),
+            (
+                {"context": "In the context of machine learning"},
+                {"context": "In the context of machine learning"},
+            ),
+            ({"constraints": {"max_length": 500}}, {"constraints": {"max_length": 500}}),
+        ],
+        ids=["defaults", "context", "constraints"],
+    )
+    def test_question_creation(self, kwargs, expected):
         """Test creating a question."""
-        q = Question(question="What is AI?")
-        assert q.question == "What is AI?"
-        assert q.context is None
+        q = Question(question="What is AI?", **kwargs)
+        for field, value in expected.items():
+            assert getattr(q, field) == value
         assert isinstance(q.timestamp, datetime)
 
-    def test_question_with_context(self):
-        """Test creating a question with context."""
-        q = Question(question="What is AI?", context="In the context of machine learning")
-        assert q.context == "In the context of machine learning"
-
-    def test_question_with_constraints(self):
-        """Test creating a question with constraints."""
-        q = Question(question="What is AI?", constraints={"max_length": 500})
-        assert q.constraints["max_length"] == 500
-
 
 class TestSource:
     """Tests for Source model."""
 
-    def test_source_creation(self):
+    @pytest.mark.parametrize(
+        ("kwargs", "expected"),
+        [
+            (
+                {
+                    "title": "AI Research Paper",
+                    "url": "https://example.com",
+                    "source_type": SourceType.RESEARCH,
+                    "confidence": 0.9,
+                },
+                {
+                    "title": "AI Research Paper",
+                    "confidence": 0.9,
+                    "source_type": SourceType.RESEARCH,
+                },
+            ),
+            ({"title": "Test", "source_type": SourceType.WEB}, {"confidence": 1.0}),
+            (
+                {
+                    "title": "Test",
+                    "source_type": SourceType.INTERNAL,
+                    "metadata": {"author": "John Doe", "year": 2026},
+                },
+                {"metadata": {"author": "John Doe", "year": 2026}},
+            ),
+        ],
+        ids=["explicit-values", "default-confidence", "metadata"],
+    )
+    def test_source_creation(self, kwargs, expected):
         """Test creating a source."""
-        source = Source(
-            title="AI Research Paper",
-            url="https://example.com",
-            source_type=SourceType.RESEARCH,
-            confidence=0.9,
-        )
-        assert source.title == "AI Research Paper"
-        assert source.confidence == 0.9
-        assert source.source_type == SourceType.RESEARCH
-
-    def test_source_default_confidence(self):
-        """Test source default confidence is 1.0."""
-        source = Source(title="Test", source_type=SourceType.WEB)
-        assert source.confidence == 1.0
-
-    def test_source_with_metadata(self):
-        """Test source with metadata."""
-        source = Source(
-            title="Test",
-            source_type=SourceType.INTERNAL,
-            metadata={"author": "John Doe", "year": 2026},
-        )
-        assert source.metadata["author"] == "John Doe"
-        assert source.metadata["year"] == 2026
+        source = Source(**kwargs)
+        for field, value in expected.items():
+            assert getattr(source, field) == value
 
 
 class TestAgentMessage:
@@ -81,9 +108,8 @@ class TestAgentMessage:
 class TestAnswer:
     """Tests for Answer model."""
 
-    def test_answer_creation(self):
+    def test_answer_creation(self, question):
         """Test creating an answer."""
-        question = Question(question="What is AI?")
         answer = Answer(
             question=question,
             answer="AI is artificial intelligence",
@@ -96,13 +122,8 @@ class TestAnswer:
         assert answer.reasoning == "Based on research"
         assert isinstance(answer.timestamp, datetime)
 
-    def test_answer_with_sources(self):
+    def test_answer_with_sources(self, question, sources):
         """Test answer with sources."""
-        question = Question(question="What is AI?")
-        sources = [
-            Source(title="Source 1", source_type=SourceType.RESEARCH),
-            Source(title="Source 2", source_type=SourceType.WEB),
-        ]
         answer = Answer(
             question=question,
             answer="Test answer",
@@ -113,9 +134,8 @@ class TestAnswer:
         assert len(answer.sources) == 2
         assert answer.sources[0].title == "Source 1"
 
-    def test_answer_with_agent_contributions(self):
+    def test_answer_with_agent_contributions(self, question):
         """Test answer with agent contributions."""
-        question = Question(question="What is AI?")
         msg = AgentMessage(agent_name="researcher", content="Research findings")
         answer = Answer(
             question=question,
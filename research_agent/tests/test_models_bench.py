@@ -0,0 +1,45 @@
+"""
+Construction benchmarks for the data models.
+
+Run with pytest-benchmark installed; skipped otherwise.
+"""
+
+import pytest
+
+from src.models import AgentMessage, Answer, Question, Source, SourceType
+
+pytest.importorskip("pytest_benchmark")
+
+pytestmark = pytest.mark.benchmark(group="models")
+
+
+def test_question_construction(benchmark):
+    """Benchmark building a Question."""
+    benchmark(Question, question="What is AI?")
+
+
+def test_source_construction(benchmark):
+    """Benchmark building a Source."""
+    benchmark(
+        Source,
+        title="AI Research Paper",
+        url="https://example.com",
+        source_type=SourceType.RESEARCH,
+    )
+
+
+def test_answer_construction(benchmark):
+    """Benchmark building an Answer with sources and agent contributions."""
+    question = Question(question="What is AI?")
+    sources = [Source(title=f"Source {i}", source_type=SourceType.WEB) for i in range(5)]
+    contributions = [AgentMessage(agent_name="researcher", content="Research findings")]
+
+    benchmark(
+        Answer,
+        question=question,
+        answer="AI is artificial intelligence",
+        sources=sources,
+        reasoning="Based on research",
+        confidence=0.85,
+        agent_contributions=contributions,
+    )